@@ -10,59 +10,80 @@ Usage:
 from __future__ import annotations
 
 import argparse
-
-from canvas.connection import CanvasConnection
-from canvas.course import Course
-from canvas.gradebook import get_course_gradebook
+import sys
 
 
 def main():
     parser = argparse.ArgumentParser(description="Analyze Canvas course grades")
     parser.add_argument("--course-id", type=int, help="Canvas course ID (optional)")
+    parser.add_argument("--refresh-courses", action="store_true",
+                       help="Ignore the cached course list when prompting for a course")
     parser.add_argument("--student-id", type=int, help="Specific student user ID to show details (optional)")
     parser.add_argument("--include-inactive", action="store_true", help="Include inactive enrollments")
     args = parser.parse_args()
 
+    # Imported after argument parsing so --help doesn't pay for canvasapi/requests
+    from canvas.connection import CanvasConnection
+    from canvas.course import Course
+    from canvas.gradebook import Gradebook, get_course_gradebook
+
     conn = CanvasConnection()
-    course = Course.from_args(conn, args.course_id)
-    gb = get_course_gradebook(conn, course.course_id, include_inactive=args.include_inactive)
+    course = Course.from_args(conn, args.course_id, refresh_courses=args.refresh_courses)
+
+    # Prefer the single GraphQL query; fall back to per-assignment REST calls
+    try:
+        data = course.get_gradebook_graphql(include_inactive=args.include_inactive)
+    except Exception as e:
+        print(f"GraphQL gradebook unavailable ({e}); using REST API")
+        gb = get_course_gradebook(conn, course.course_id, include_inactive=args.include_inactive)
+    else:
+        gb = Gradebook()
+        gb.load_from_data(data["assignments"], data["submissions"], data["students"])
+        gb.course_id = course.course_id
+
+    # Collect the report and write it in one go rather than line by line
+    out: list[str] = []
 
     overall = gb.overall_stats()
-    print("\nOverall grade stats:")
+    out.append("\nOverall grade stats:")
     for k in ["count", "mean", "median", "std", "min", "max"]:
         if k in overall:
-            print(f"  {k}: {overall[k]}")
+            out.append(f"  {k}: {overall[k]}")
+
+    assignments = gb.get_assignments()
 
     # Assignment stats
-    print("\nAssignment stats:")
-    for a in gb.get_assignments():
+    out.append("\nAssignment stats:")
+    for a in assignments:
         stats = gb.assignment_stats(a.id)
         m = stats.get("mean")
-        print(f"  - {a.name} [id={a.id}, pts={a.points_possible}]: count={stats['count']}, mean={m}, missing={stats['missing']}, excused={stats['excused']}")
+        out.append(f"  - {a.name} [id={a.id}, pts={a.points_possible}]: count={stats['count']}, mean={m}, missing={stats['missing']}, excused={stats['excused']}")
 
     # Top students by percent
-    print("\nTop students by percent:")
+    out.append("\nTop students by percent:")
     for uid, pct in gb.top_students(10):
-        print(f"  - user {uid}: {pct:.2f}%")
+        out.append(f"  - user {uid}: {pct:.2f}%")
 
     # Optional student detail
     if args.student_id is not None:
         s = gb.get_student(args.student_id)
         if not s:
-            print(f"\nStudent {args.student_id} not found")
+            out.append(f"\nStudent {args.student_id} not found")
         else:
-            print(f"\nStudent detail for {s.name or s.login or s.id} (id={s.id}):")
+            out.append(f"\nStudent detail for {s.name or s.login or s.id} (id={s.id}):")
             pct_str = f"{s.percent:.2f}%" if s.percent is not None else "N/A"
-            print(f"  Total: {s.total_score}/{s.total_points} ({pct_str})")
-            for a in gb.get_assignments():
+            out.append(f"  Total: {s.total_score}/{s.total_points} ({pct_str})")
+            for a in assignments:
                 sc = s.scores.get(a.id)
                 if sc is None:
-                    print(f"    - {a.name}: (no submission)")
+                    out.append(f"    - {a.name}: (no submission)")
                 else:
                     flag = "excused" if sc.excused else ("missing" if sc.missing else ("late" if sc.late else ""))
                     flag = f" ({flag})" if flag else ""
                     pts = a.points_possible if a.points_possible is not None else "?"
-                    print(f"    - {a.name}: {sc.score}/{pts}{flag}")
+                    out.append(f"    - {a.name}: {sc.score}/{pts}{flag}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -4,19 +4,29 @@ canvas.py
 --------------------------------
 CLI entrypoint using extracted modules for Canvas LMS interactions.
 Provides interactive course selection and optional roster summary.
+
+Usage:
+  python3 canvas.py [--refresh]
 """
 
+import argparse
 import sys
-from canvas.connection import CanvasConnection
-from canvas.course import Course
 
 
 def main():
     """Main entry point for interactive course selection."""
+    parser = argparse.ArgumentParser(description="Select a Canvas course and show its roster")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cached course list and refetch from Canvas")
+    args = parser.parse_args()
+
+    # Imported after argument parsing so --help doesn't pay for canvasapi/requests
+    from canvas.connection import CanvasConnection
+    from canvas.course import Course
+
     try:
         # Initialize connection and get course
         connection = CanvasConnection()
-        course = Course.from_args(connection)
+        course = Course.from_args(connection, refresh_courses=args.refresh)
 
         # Fetch and display roster
         try:
@@ -6,11 +6,12 @@ Assignment and AssignmentGroup classes for working with Canvas assignments.
 """
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignmentGroup:
     """Represents an assignment group (category/type)."""
     id: int
@@ -28,8 +29,18 @@ class AssignmentGroup:
             group_weight=getattr(canvas_group, 'group_weight', None),
         )
 
+    @classmethod
+    def from_attrs(cls, attrs: Dict[str, Any]) -> "AssignmentGroup":
+        """Create AssignmentGroup from the raw JSON dict of a Canvas API object."""
+        return cls(
+            id=attrs['id'],
+            name=attrs['name'],
+            position=attrs.get('position'),
+            group_weight=attrs.get('group_weight'),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     """Represents an assignment with key metadata."""
     id: int
@@ -53,10 +64,30 @@ class Assignment:
             submission_types=getattr(canvas_assignment, 'submission_types', None),
         )
 
+    @classmethod
+    def from_attrs(cls, attrs: Dict[str, Any]) -> "Assignment":
+        """Create Assignment from the raw JSON dict of a Canvas API object.
+
+        canvasapi sets each response field directly in the object's
+        ``__dict__``, so ``vars(obj)`` can be read with plain dict lookups,
+        which is cheaper than ``getattr`` on the wrapper object.
+        """
+        return cls(
+            id=attrs['id'],
+            name=attrs['name'],
+            assignment_group_id=attrs.get('assignment_group_id'),
+            points_possible=attrs.get('points_possible'),
+            due_at=attrs.get('due_at'),
+            published=attrs.get('published'),
+            submission_types=attrs.get('submission_types'),
+        )
+
 
 class AssignmentManager:
     """Manages assignments and assignment groups for a course."""
 
+    __slots__ = ("course", "_groups", "_assignments", "_group_by_id", "_assignment_by_id", "_by_group_cache")
+
     def __init__(self, course: Any):
         """Initialize with a Canvas course object.
 
@@ -66,6 +97,9 @@ class AssignmentManager:
         self.course = course
         self._groups: Optional[List[AssignmentGroup]] = None
         self._assignments: Optional[List[Assignment]] = None
+        self._group_by_id: Optional[Dict[int, AssignmentGroup]] = None
+        self._assignment_by_id: Optional[Dict[int, Assignment]] = None
+        self._by_group_cache: Optional[Dict[Optional[int], tuple[Optional[AssignmentGroup], List[Assignment]]]] = None
 
     @property
     def groups(self) -> List[AssignmentGroup]:
@@ -73,7 +107,7 @@ class AssignmentManager:
         if self._groups is None:
             try:
                 self._groups = [
-                    AssignmentGroup.from_canvas(g)
+                    AssignmentGroup.from_attrs(vars(g))
                     for g in self.course.get_assignment_groups()
                 ]
             except Exception:
@@ -86,7 +120,7 @@ class AssignmentManager:
         if self._assignments is None:
             try:
                 self._assignments = [
-                    Assignment.from_canvas(a)
+                    Assignment.from_attrs(vars(a))
                     for a in self.course.get_assignments()
                 ]
             except Exception:
@@ -100,31 +134,34 @@ class AssignmentManager:
             Dict mapping group_id to (group_object, [assignments])
             None key holds ungrouped assignments
         """
-        group_map = {g.id: g for g in self.groups}
-        by_group: Dict[Optional[int], List[Assignment]] = {}
+        if self._by_group_cache is not None:
+            return self._by_group_cache
+
+        group_map = self._group_index()
+        by_group: Dict[Optional[int], List[Assignment]] = defaultdict(list)
 
         for a in self.assignments:
-            gid = a.assignment_group_id
-            if gid not in by_group:
-                by_group[gid] = []
-            by_group[gid].append(a)
+            by_group[a.assignment_group_id].append(a)
 
         result = {}
         for gid, assgns in by_group.items():
             result[gid] = (group_map.get(gid), assgns)
 
+        self._by_group_cache = result
         return result
 
     def get_group_by_id(self, group_id: int) -> Optional[AssignmentGroup]:
         """Get assignment group by ID."""
-        for g in self.groups:
-            if g.id == group_id:
-                return g
-        return None
+        return self._group_index().get(group_id)
 
     def get_assignment_by_id(self, assignment_id: int) -> Optional[Assignment]:
         """Get assignment by ID."""
-        for a in self.assignments:
-            if a.id == assignment_id:
-                return a
-        return None
+        if self._assignment_by_id is None:
+            self._assignment_by_id = {a.id: a for a in self.assignments}
+        return self._assignment_by_id.get(assignment_id)
+
+    def _group_index(self) -> Dict[int, AssignmentGroup]:
+        """Return (building once) the group_id -> AssignmentGroup index."""
+        if self._group_by_id is None:
+            self._group_by_id = {g.id: g for g in self.groups}
+        return self._group_by_id
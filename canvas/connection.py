@@ -5,9 +5,219 @@ connection.py
 CanvasConnection: manages Canvas API client initialization.
 """
 from canvasapi import Canvas
+import functools
+import hashlib
 import json
+import os
 from pathlib import Path
 import getpass
+import re
+import time
+from urllib.parse import urlsplit
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+CONFIG_FILE = Path("canvas-token.json")
+HTTP_CACHE_DIR = Path(".canvas_http_cache")
+# Set CANVAS_HTTP_CACHE=0 to disable the ETag cache
+HTTP_CACHE_ENV = "CANVAS_HTTP_CACHE"
+# Entries unused for longer than this, or beyond the size budget (least
+# recently used first), are pruned when the session is created
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Only course and assignment list responses are cached; enrollments,
+# submissions and other per-student data never touch the disk
+_CACHEABLE_PATH = re.compile(r"/api/v1/courses/\d+(/assignments)?/?$")
+
+# Response headers replayed from the cache on a 304 (Link carries pagination)
+_CACHED_HEADERS = ("Content-Type", "Link")
+
+# Throttled requests are retried up to THROTTLE_RETRIES times, sleeping
+# THROTTLE_BACKOFF seconds before the first retry and doubling each time
+THROTTLE_RETRIES = 5
+THROTTLE_BACKOFF = 0.5
+
+_session: Optional[requests.Session] = None
+
+
+def _is_throttled(response: requests.Response) -> bool:
+    """Return True if Canvas rejected the request for exceeding its rate limit.
+
+    Canvas reports throttling as 403 Forbidden with a "Rate Limit Exceeded"
+    body and an exhausted X-Rate-Limit-Remaining budget, rather than 429.
+    """
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+    try:
+        if float(response.headers.get("X-Rate-Limit-Remaining", "1")) <= 0:
+            return True
+    except ValueError:
+        pass
+    return b"Rate Limit Exceeded" in response.content
+
+
+class _ThrottleAdapter(HTTPAdapter):
+    """HTTPAdapter that retries requests Canvas throttled, with backoff.
+
+    A throttled request was rejected before Canvas acted on it, so it is safe
+    to resend whatever the method, POST included. Requests with a streamed
+    body (file uploads) cannot be replayed and are returned as they are.
+    """
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        response = super().send(request, **kwargs)
+        if not isinstance(request.body, (bytes, str, type(None))):
+            return response
+        for attempt in range(THROTTLE_RETRIES):
+            if not _is_throttled(response):
+                break
+            try:
+                delay = float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                delay = THROTTLE_BACKOFF * 2 ** attempt
+            response.close()
+            time.sleep(delay)
+            response = super().send(request, **kwargs)
+        return response
+
+
+class _ETagAdapter(_ThrottleAdapter):
+    """HTTPAdapter that revalidates GET requests with If-None-Match.
+
+    Bodies of GET responses carrying an ETag from a _CACHEABLE_PATH endpoint
+    are kept in cache_dir (owner-only), keyed by URL and Authorization
+    header. The next request for the same URL sends the stored ETag; if
+    Canvas answers 304 Not Modified, the cached body is replayed as a normal
+    200 response, so canvasapi never sees the difference.
+    """
+
+    def __init__(self, cache_dir: Path, **kwargs):
+        self.cache_dir = cache_dir
+        super().__init__(**kwargs)
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete stale entries, then the least recently used beyond the size budget."""
+        try:
+            entries = [(p, p.stat()) for p in self.cache_dir.iterdir()]
+        except OSError:
+            return
+        cutoff = time.time() - HTTP_CACHE_MAX_AGE
+        total = 0
+        for p, st in sorted(entries, key=lambda e: e[1].st_mtime, reverse=True):
+            total += st.st_size
+            if st.st_mtime < cutoff or total > HTTP_CACHE_MAX_BYTES:
+                p.unlink(missing_ok=True)
+
+    def _cache_path(self, request: requests.PreparedRequest) -> Path:
+        key = f"{request.headers.get('Authorization', '')} {request.url}"
+        return self.cache_dir / hashlib.sha256(key.encode()).hexdigest()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if (request.method != "GET" or kwargs.get("stream")
+                or not _CACHEABLE_PATH.search(urlsplit(request.url).path)):
+            return super().send(request, **kwargs)
+
+        path = self._cache_path(request)
+        cached = None
+        try:
+            # Cache entry: one line of JSON metadata, then the raw body
+            meta, _, body = path.read_bytes().partition(b"\n")
+            cached = (_loads(meta), body)
+            request.headers["If-None-Match"] = cached[0]["etag"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            response.status_code = 200
+            response.reason = "OK"
+            response.headers.update(cached[0]["headers"])
+            response._content = cached[1]
+            try:
+                os.utime(path)  # mark as recently used for _prune
+            except OSError:
+                pass
+        elif response.status_code == 200 and response.headers.get("ETag"):
+            self._store(path, response)
+        return response
+
+    def _store(self, path: Path, response: requests.Response) -> None:
+        meta = {
+            "etag": response.headers["ETag"],
+            "headers": {h: response.headers[h] for h in _CACHED_HEADERS if h in response.headers},
+        }
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps(meta) + b"\n" + response.content)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _shared_session() -> requests.Session:
+    """Return the process-wide HTTP session used for Canvas requests.
+
+    Reusing one keep-alive session avoids a fresh TCP/TLS handshake for every
+    CanvasConnection. Throttled requests (Canvas answers 403 "Rate Limit
+    Exceeded") are retried for every method by _ThrottleAdapter; transient 5xx
+    errors are retried with exponential backoff for idempotent methods only,
+    since a POST that failed server-side may still have created its object.
+    Course and assignment list GETs are revalidated by ETag against
+    HTTP_CACHE_DIR (see _ETagAdapter) unless CANVAS_HTTP_CACHE=0.
+    """
+    global _session
+    if _session is None:
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,  # hand the final response back to canvasapi
+        )
+        pool_args = dict(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        if os.environ.get(HTTP_CACHE_ENV, "1") == "0":
+            adapter = _ThrottleAdapter(**pool_args)
+        else:
+            adapter = _ETagAdapter(HTTP_CACHE_DIR, **pool_args)
+        _session = requests.Session()
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+@functools.lru_cache(maxsize=4)
+def _read_config(path: str, mtime_ns: int) -> dict:
+    """Parse a token config file; cached per (path, mtime) so unchanged files are read once."""
+    try:
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+    except (ValueError, IOError):
+        return {}
+    # Expect a dict with api_key and optionally api_url
+    if isinstance(data, dict) and 'api_key' in data:
+        return data
+    return {}
 
 
 class CanvasConnection:
@@ -19,14 +229,15 @@ class CanvasConnection:
 
         Args:
             canvas_url: Canvas instance URL (defaults to MIT Canvas or canvas-token.json)
-            access_token: Canvas API token (tries canvas-token.json first, prompts if missing)
+            access_token: Canvas API token (tries the CANVAS_TOKEN environment
+                variable, then canvas-token.json, and prompts if still missing)
             prompt_if_missing: If True, prompts for token if not found (default: True)
         """
         # Try to load from canvas-token.json if parameters not provided
         config = self._load_config()
         
         self.canvas_url = canvas_url or config.get("api_url") or "https://canvas.mit.edu"
-        self.access_token = access_token or config.get("api_key")
+        self.access_token = access_token or os.environ.get("CANVAS_TOKEN") or config.get("api_key")
 
         if not self.access_token and prompt_if_missing:
             self.access_token = self._prompt_and_save_token()
@@ -34,25 +245,30 @@ class CanvasConnection:
         if not self.access_token:
             raise ValueError(
                 "Canvas access token required. Either:\n"
-                "  1. Create canvas-token.json with 'api_key' field, or\n"
-                "  2. Provide token via command line"
+                "  1. Set the CANVAS_TOKEN environment variable, or\n"
+                "  2. Create canvas-token.json with 'api_key' field, or\n"
+                "  3. Provide token via command line"
             )
 
         self.canvas = Canvas(self.canvas_url, self.access_token)
+        # canvasapi builds a private requests.Session per client; swap in the shared one
+        self.canvas._Canvas__requester._session = _shared_session()
+        self._courses: Dict[int, Any] = {}
+
+    def get_course_cached(self, course_id: int) -> Any:
+        """Return the canvasapi Course for course_id, fetching it at most once per connection."""
+        course = self._courses.get(course_id)
+        if course is None:
+            course = self._courses[course_id] = self.canvas.get_course(course_id)
+        return course
 
     def _load_config(self) -> dict:
         """Load configuration from canvas-token.json if it exists."""
-        config_path = Path("canvas-token.json")
-        if config_path.exists():
-            try:
-                with open(config_path, 'r') as f:
-                    data = json.load(f)
-                    # Expect a dict with api_key and optionally api_url
-                    if isinstance(data, dict) and 'api_key' in data:
-                        return data
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {}
+        try:
+            mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            return {}
+        return dict(_read_config(str(CONFIG_FILE), mtime_ns))
 
     def _prompt_and_save_token(self) -> str:
         """Prompt user for Canvas API token and save to canvas-token.json."""
@@ -66,11 +282,17 @@ class CanvasConnection:
                 "api_url": self.canvas_url,
                 "api_key": token
             }
+            # Write to a private temp file and rename, so the token is never
+            # world-readable and an interrupted write can't corrupt the file
+            tmp_path = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
             try:
-                with open("canvas-token.json", 'w') as f:
-                    json.dump(config, f, indent=2)
-                print("Token saved to canvas-token.json")
-            except IOError as e:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_dumps(config, indent=True))
+                os.replace(tmp_path, CONFIG_FILE)
+                print(f"Token saved to {CONFIG_FILE}")
+            except OSError as e:
+                tmp_path.unlink(missing_ok=True)
                 print(f"Warning: Could not save token to file: {e}")
         
         return token
@@ -78,3 +300,33 @@ class CanvasConnection:
     def get_canvas(self) -> Canvas:
         """Return the Canvas API client."""
         return self.canvas
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a query against the Canvas GraphQL endpoint.
+
+        Args:
+            query: GraphQL query string
+            variables: Optional query variables
+
+        Returns:
+            The "data" member of the GraphQL response
+
+        Raises:
+            RuntimeError: If the request fails or the response contains errors
+        """
+        try:
+            response = _shared_session().post(
+                f"{self.canvas_url.rstrip('/')}/api/graphql",
+                json={"query": query, "variables": variables or {}},
+                headers={"Authorization": f"Bearer {self.access_token}"},
+                timeout=60,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise RuntimeError(f"GraphQL request failed: {e}")
+
+        if payload.get("errors"):
+            messages = "; ".join(err.get("message", str(err)) for err in payload["errors"])
+            raise RuntimeError(f"GraphQL query failed: {messages}")
+        return payload.get("data") or {}
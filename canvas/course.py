@@ -7,7 +7,8 @@ Consolidates course selection and common operations.
 """
 from __future__ import annotations
 
-from typing import Any, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from .connection import CanvasConnection
 from .course_selector import CourseSelector
@@ -15,6 +16,64 @@ from .course_selector import CourseSelector
 if TYPE_CHECKING:
     from .roster import Roster
 
+# Canvas caps page size at 100; the default of 10 multiplies round-trips.
+PER_PAGE = 100
+
+ENROLLMENT_TYPES = [
+    "StudentEnrollment",
+    "TeacherEnrollment",
+    "TaEnrollment",
+    "ObserverEnrollment",
+    "DesignerEnrollment",
+]
+
+# Parallel requests per course; keeps us well inside Canvas's rate-limit budget
+MAX_WORKERS = 8
+
+_SUBMISSION_FIELDS = """
+    pageInfo { hasNextPage endCursor }
+    nodes { userId score excused late missing submittedAt state }
+"""
+
+_SUBMISSION_FILTER = "filter: {states: [unsubmitted, submitted, pending_review, graded, ungraded]}"
+
+_GRADEBOOK_QUERY = """
+query Gradebook($courseId: ID!, $after: String) {
+  course(id: $courseId) {
+    assignmentsConnection(first: 50, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        _id
+        name
+        pointsPossible
+        dueAt
+        assignmentGroup { _id }
+        submissionsConnection(%s) { %s }
+      }
+    }
+  }
+}
+""" % (_SUBMISSION_FILTER, _SUBMISSION_FIELDS)
+
+_SUBMISSIONS_PAGE_QUERY = """
+query SubmissionsPage($assignmentId: ID!, $after: String) {
+  assignment(id: $assignmentId) {
+    submissionsConnection(%s, after: $after) { %s }
+  }
+}
+""" % (_SUBMISSION_FILTER, _SUBMISSION_FIELDS)
+
+_STUDENTS_QUERY = """
+query Students($courseId: ID!, $states: [EnrollmentWorkflowState!], $after: String) {
+  course(id: $courseId) {
+    enrollmentsConnection(filter: {types: [StudentEnrollment], states: $states}, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      nodes { user { _id name loginId email sisId } }
+    }
+  }
+}
+"""
+
 
 class Course:
     """Wrapper for Canvas course with convenience methods."""
@@ -31,19 +90,25 @@ class Course:
         self._canvas_course: Optional[Any] = None
 
     @classmethod
-    def from_args(cls, canvas_connection: CanvasConnection, course_id: Optional[int] = None) -> "Course":
+    def from_args(
+        cls,
+        canvas_connection: CanvasConnection,
+        course_id: Optional[int] = None,
+        refresh_courses: bool = False,
+    ) -> "Course":
         """Create Course from optional course_id, using interactive selection if needed.
 
         Args:
             canvas_connection: Active CanvasConnection instance
             course_id: Optional course ID; if None, prompts user interactively
+            refresh_courses: If True, bypass the cached course list when prompting
 
         Returns:
             Course instance
         """
         if course_id is None:
             selector = CourseSelector(canvas_connection)
-            course_id = selector.select_course_interactive()
+            course_id = selector.select_course_interactive(refresh=refresh_courses)
 
         return cls(canvas_connection, course_id)
 
@@ -51,8 +116,7 @@ class Course:
     def canvas_course(self) -> Any:
         """Lazy-load and return the Canvas course object."""
         if self._canvas_course is None:
-            canvas = self.canvas_connection.get_canvas()
-            self._canvas_course = canvas.get_course(self.course_id)
+            self._canvas_course = self.canvas_connection.get_course_cached(self.course_id)
         return self._canvas_course
 
     @property
@@ -65,17 +129,200 @@ class Course:
         """Get the course code."""
         return getattr(self.canvas_course, 'course_code', str(self.course_id))
 
-    def get_assignments(self) -> list:
-        """Get all assignments for this course."""
-        return list(self.canvas_course.get_assignments())
+    def get_assignments(self) -> Iterable[Any]:
+        """Get all assignments for this course.
+
+        Returns the paginated result unmaterialized, so pages are fetched as
+        the caller iterates; wrap in ``list()`` if random access is needed.
+        """
+        return self.canvas_course.get_assignments(per_page=PER_PAGE)
+
+    def get_assignment_groups(self) -> Iterable[Any]:
+        """Get all assignment groups for this course (fetched lazily, page by page)."""
+        return self.canvas_course.get_assignment_groups(per_page=PER_PAGE)
+
+    def get_enrollments(self, **kwargs) -> Iterable[Any]:
+        """Get enrollments for this course (fetched lazily, page by page)."""
+        return self.canvas_course.get_enrollments(**{"per_page": PER_PAGE, **kwargs})
+
+    def get_multiple_submissions(
+        self,
+        assignment_ids: Iterable[int],
+        include: Optional[List[str]] = None,
+    ) -> Dict[int, List[Any]]:
+        """Fetch submissions for several assignments in one paginated request.
+
+        Uses Canvas's students/submissions endpoint for all students at once,
+        instead of one assignment lookup plus one submissions listing per
+        assignment.
+
+        Args:
+            assignment_ids: IDs of the assignments to fetch
+            include: Optional list of Canvas include[] values (e.g. ["user"])
+
+        Returns:
+            Dict mapping each requested assignment ID to its list of submissions
+
+        Raises:
+            canvasapi.exceptions.ResourceDoesNotExist: If this Canvas instance
+                does not offer the students/submissions endpoint
+        """
+        ids = list(assignment_ids)
+        by_assignment: Dict[int, List[Any]] = {aid: [] for aid in ids}
+        if not ids:
+            return by_assignment
+        submissions = self.canvas_course.get_multiple_submissions(
+            student_ids=["all"],
+            assignment_ids=ids,
+            include=include or [],
+            per_page=PER_PAGE,
+        )
+        for sub in submissions:
+            subs = by_assignment.get(getattr(sub, 'assignment_id', None))
+            if subs is not None:
+                subs.append(sub)
+        return by_assignment
+
+    def get_submissions_by_assignment(
+        self,
+        assignments: Iterable[Any],
+        include: Optional[List[str]] = None,
+        max_workers: int = MAX_WORKERS,
+    ) -> Dict[int, List[Any]]:
+        """Fetch submissions for several assignments concurrently.
+
+        Per-assignment fallback for get_multiple_submissions(): the requests
+        are issued from a small thread pool. Listings are made from the
+        canvasapi assignments the caller already holds, so no get_assignment()
+        request is spent just to learn the URL.
 
-    def get_assignment_groups(self) -> list:
-        """Get all assignment groups for this course."""
-        return list(self.canvas_course.get_assignment_groups())
+        Args:
+            assignments: canvasapi Assignment objects (e.g. from
+                canvas_course.get_assignments())
+            include: Optional list of Canvas include[] values (e.g. ["user"])
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dict mapping assignment ID to its list of submissions. Assignments
+            whose submissions could not be fetched are reported and omitted.
+        """
+        def fetch(assignment: Any):
+            # One failed assignment must not lose the others
+            try:
+                return assignment.id, list(assignment.get_submissions(include=include or [], per_page=PER_PAGE))
+            except Exception as e:
+                print(f"Warning: Could not fetch submissions for assignment {assignment.id}: {e}")
+                return assignment.id, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, assignments))
+        return {aid: subs for aid, subs in results if subs is not None}
+
+    def get_gradebook_graphql(self, include_inactive: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch assignments, submissions and students via Canvas GraphQL.
+
+        A single paginated query returns every assignment together with its
+        submissions, replacing the one-request-per-assignment REST traversal.
+
+        Args:
+            include_inactive: Whether to include inactive student enrollments
+
+        Returns:
+            Dict with "assignments", "submissions" and "students" lists, in
+            the format accepted by Gradebook.load_from_data()
+
+        Raises:
+            RuntimeError: If the GraphQL endpoint is unavailable or errors
+        """
+        conn = self.canvas_connection
+        assignments: List[Dict[str, Any]] = []
+        submissions: List[Dict[str, Any]] = []
+
+        after = None
+        while True:
+            data = conn.graphql(_GRADEBOOK_QUERY, {"courseId": str(self.course_id), "after": after})
+            connection = (data.get("course") or {}).get("assignmentsConnection") or {}
+            for node in connection.get("nodes") or []:
+                aid = int(node["_id"])
+                group = node.get("assignmentGroup") or {}
+                assignments.append({
+                    "id": aid,
+                    "name": node.get("name"),
+                    "points_possible": node.get("pointsPossible"),
+                    "due_at": node.get("dueAt"),
+                    "assignment_group_id": int(group["_id"]) if group.get("_id") else None,
+                })
+
+                subs = node.get("submissionsConnection") or {}
+                while True:
+                    for sub in subs.get("nodes") or []:
+                        if sub.get("userId") is None:
+                            continue
+                        submissions.append({
+                            "user_id": int(sub["userId"]),
+                            "assignment_id": aid,
+                            "score": sub.get("score"),
+                            "submitted_at": sub.get("submittedAt"),
+                            "workflow_state": sub.get("state"),
+                            "late": sub.get("late"),
+                            "missing": sub.get("missing"),
+                            "excused": sub.get("excused"),
+                        })
+                    page = subs.get("pageInfo") or {}
+                    if not page.get("hasNextPage"):
+                        break
+                    more = conn.graphql(_SUBMISSIONS_PAGE_QUERY, {"assignmentId": str(aid), "after": page.get("endCursor")})
+                    subs = (more.get("assignment") or {}).get("submissionsConnection") or {}
+
+            page = connection.get("pageInfo") or {}
+            if not page.get("hasNextPage"):
+                break
+            after = page.get("endCursor")
+
+        students: Dict[int, Dict[str, Any]] = {}
+        states = None if include_inactive else ["active"]
+        after = None
+        while True:
+            data = conn.graphql(_STUDENTS_QUERY, {"courseId": str(self.course_id), "states": states, "after": after})
+            connection = (data.get("course") or {}).get("enrollmentsConnection") or {}
+            for node in connection.get("nodes") or []:
+                user = node.get("user") or {}
+                if not user.get("_id"):
+                    continue
+                uid = int(user["_id"])
+                students[uid] = {
+                    "id": uid,
+                    "name": user.get("name"),
+                    "login": user.get("loginId"),
+                    "email": user.get("email"),
+                    "sis_user_id": user.get("sisId"),
+                }
+            page = connection.get("pageInfo") or {}
+            if not page.get("hasNextPage"):
+                break
+            after = page.get("endCursor")
+
+        return {
+            "assignments": assignments,
+            "submissions": submissions,
+            "students": list(students.values()),
+        }
 
-    def get_enrollments(self, **kwargs) -> list:
-        """Get enrollments for this course."""
-        return list(self.canvas_course.get_enrollments(**kwargs))
+    def fetch_all_enrollments(self, include_inactive: bool = False) -> Dict[str, List[Any]]:
+        """Fetch enrollments of every role in one paginated request.
+
+        Args:
+            include_inactive: Whether to include inactive enrollments
+
+        Returns:
+            Dict mapping Canvas enrollment type (e.g. "StudentEnrollment") to
+            the list of enrollments of that type
+        """
+        state = None if include_inactive else ["active"]
+        by_type: Dict[str, List[Any]] = {}
+        for enr in self.get_enrollments(type=ENROLLMENT_TYPES, state=state):
+            by_type.setdefault(getattr(enr, "type", None), []).append(enr)
+        return by_type
 
     def get_roster(self, include_inactive: bool = False) -> "Roster":
         """Get roster for this course.
@@ -88,5 +335,9 @@ class Course:
         """
         from .roster import Roster
         roster = Roster()
-        roster.load_from_canvas(self.canvas_course, include_inactive=include_inactive)
+        roster.load_from_canvas(
+            self.canvas_course,
+            include_inactive=include_inactive,
+            prefetched=self.fetch_all_enrollments(include_inactive=include_inactive),
+        )
         return roster
@@ -7,17 +7,39 @@ CourseSelector: retrieves courses and supports interactive selection.
 from __future__ import annotations
 
 from datetime import datetime
-import json
+import hashlib
 import os
 import re
 import sys
+import time
+from types import SimpleNamespace
 from typing import Any, List, Optional
 
+from .connection import _dumps, _loads
+
+# Active courses change at most once per term; refetch after a day
+COURSE_CACHE_TTL = 24 * 60 * 60
+
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+
+def _iso_year(timestamp: str) -> int:
+    """Return the year of an ISO-8601 timestamp, skipping a full parse when possible."""
+    if timestamp[:4].isdigit() and timestamp[4:5] == '-':
+        return int(timestamp[:4])
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).year
+
 
 class CourseSelector:
     """Handles course retrieval and interactive selection."""
 
-    def __init__(self, canvas_connection, default_course_id: int = 21489, config_file: Optional[str] = None):
+    def __init__(
+        self,
+        canvas_connection,
+        default_course_id: int = 21489,
+        config_file: Optional[str] = None,
+        cache_file: Optional[str] = None,
+    ):
         """
         Initialize course selector.
 
@@ -25,22 +47,86 @@ class CourseSelector:
             canvas_connection: object with get_canvas() -> Canvas API client
             default_course_id: Default course ID for first-time use
             config_file: Path to session persistence file
+            cache_file: Path to active-courses cache file (default: a file in
+                the working directory, next to the other caches, named by a
+                hash of the Canvas URL and token so accounts never share it)
         """
         self.canvas = canvas_connection.get_canvas()
         self.default_course_id = default_course_id
         self.config_file = config_file or os.path.join(
             os.path.dirname(__file__), ".canvas_session.json"
         )
+        if cache_file is None:
+            key = (f"{getattr(canvas_connection, 'canvas_url', '')} "
+                   f"{getattr(canvas_connection, 'access_token', '')}")
+            cache_file = f".canvas_courses_{hashlib.sha256(key.encode()).hexdigest()[:16]}.json"
+        self.cache_file = cache_file
         self.courses: List[Any] = []
+        self._years: List[Optional[int]] = []
 
-    def get_active_courses(self):
-        """Retrieve all active courses."""
-        self.courses = [c for c in self.canvas.get_courses(
+    def get_active_courses(self, refresh: bool = False):
+        """Retrieve all active courses.
+
+        Uses the on-disk course cache if it is younger than COURSE_CACHE_TTL,
+        unless refresh is True.
+        """
+        if not refresh:
+            cached = self.load_course_cache()
+            if cached is not None:
+                self._set_courses(cached)
+                return self.courses
+
+        self._set_courses([c for c in self.canvas.get_courses(
             enrollment_state='active',
-            include=['term']
-        )]
+            include=['term'],
+            per_page=100,
+        )])
+        self.save_course_cache()
         return self.courses
 
+    def _set_courses(self, courses: List[Any]) -> None:
+        """Store the course list along with each course's year, computed once."""
+        self.courses = courses
+        self._years = [self.get_course_year(c) for c in courses]
+
+    def load_course_cache(self) -> Optional[List[Any]]:
+        """Load cached courses if the cache file is fresh, else return None."""
+        try:
+            if time.time() - os.path.getmtime(self.cache_file) > COURSE_CACHE_TTL:
+                return None
+            with open(self.cache_file, 'rb') as f:
+                data = _loads(f.read())
+            return [
+                SimpleNamespace(
+                    id=c['id'],
+                    name=c['name'],
+                    start_at=c.get('start_at'),
+                    term={'name': c['term_name']} if c.get('term_name') else None,
+                    created_at=c.get('created_at'),
+                )
+                for c in data['courses']
+            ]
+        except Exception:
+            return None
+
+    def save_course_cache(self) -> None:
+        """Save the minimal course fields needed for display to the cache file."""
+        courses = []
+        for c in self.courses:
+            term = getattr(c, 'term', None)
+            courses.append({
+                'id': c.id,
+                'name': c.name,
+                'start_at': getattr(c, 'start_at', None),
+                'term_name': term.get('name') if isinstance(term, dict) else getattr(term, 'name', None),
+                'created_at': getattr(c, 'created_at', None),
+            })
+        try:
+            with open(self.cache_file, 'wb') as f:
+                f.write(_dumps({'fetched_at': time.time(), 'courses': courses}))
+        except Exception:
+            pass
+
     def get_course_year(self, course):
         """
         Extract year from course metadata.
@@ -50,20 +136,18 @@ class CourseSelector:
         try:
             # Try start_at first
             if hasattr(course, 'start_at') and course.start_at:
-                dt = datetime.fromisoformat(course.start_at.replace('Z', '+00:00'))
-                return dt.year
+                return _iso_year(course.start_at)
 
             # Try to extract from term name
             if hasattr(course, 'term') and hasattr(course.term, 'name'):
                 term_name = course.term['name']
-                match = re.search(r'\b(20\d{2})\b', term_name)
+                match = _YEAR_RE.search(term_name)
                 if match:
                     return int(match.group(1))
 
             # Try created_at as fallback
             if hasattr(course, 'created_at') and course.created_at:
-                dt = datetime.fromisoformat(course.created_at.replace('Z', '+00:00'))
-                return dt.year
+                return _iso_year(course.created_at)
         except Exception:
             pass
         return None
@@ -72,8 +156,8 @@ class CourseSelector:
         """Load the last selected course ID from config file."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = _loads(f.read())
                     return data.get('last_course_id')
         except Exception:
             pass
@@ -82,16 +166,17 @@ class CourseSelector:
     def save_selection(self, course_id: int) -> None:
         """Save the selected course ID to config file."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump({'last_course_id': course_id}, f)
+            with open(self.config_file, 'wb') as f:
+                f.write(_dumps({'last_course_id': course_id}))
         except Exception:
             pass
 
     def display_courses(self, last_selected_id: Optional[int]) -> None:
         """Display courses in a numbered menu."""
         print("\nAvailable Canvas Courses:")
-        for i, c in enumerate(self.courses, start=1):
-            year = self.get_course_year(c)
+        if len(self._years) != len(self.courses):
+            self._set_courses(self.courses)
+        for i, (c, year) in enumerate(zip(self.courses, self._years), start=1):
             year_str = f" ({year})" if year else ""
             mark = "(last)" if (last_selected_id and c.id == last_selected_id) else ""
             print(f"  {i:2d}. {c.name}{year_str} [{c.id}] {mark}")
@@ -114,15 +199,18 @@ class CourseSelector:
             print("Invalid selection. Using last selection.")
             return last_selected_id if last_selected_id is not None else self.default_course_id
 
-    def select_course_interactive(self) -> int:
+    def select_course_interactive(self, refresh: bool = False) -> int:
         """
         Interactive course selection workflow.
 
+        Args:
+            refresh: If True, ignore the course cache and refetch from Canvas
+
         Returns:
             Selected course ID
         """
         # Get courses
-        self.get_active_courses()
+        self.get_active_courses(refresh=refresh)
         if not self.courses:
             print("No courses found.")
             sys.exit(0)
@@ -18,24 +18,68 @@ Features:
 """
 from __future__ import annotations
 
+import functools
+import math
+import os
+import pickle
 import statistics
 import yaml
 from bisect import bisect
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from .gradebook import Gradebook, StudentSummary
+from .gradebook import Gradebook, StudentSummary, display_name
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.worksheet.cell_range import CellRange
+    from openpyxl.styles import Font, Alignment, NamedStyle, PatternFill, Border, Side
+    from openpyxl.styles.fonts import DEFAULT_FONT
     from openpyxl.utils import get_column_letter
     HAS_OPENPYXL = True
 except ImportError:
     HAS_OPENPYXL = False
 
 
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Concurrent file writes when saving individual reports
+REPORT_WRITE_WORKERS = 8
+
+# Below this many Excel reports, worker start-up costs more than it saves
+PARALLEL_EXCEL_MIN_REPORTS = 8
+
+# Excel report styles, built once and shared by every report
+_PCT_FMT = '0.00"%"'
+# Per-assignment percentage formula for a given row number
+_PCT_FORMULA = "=IF(C{0}>0, B{0}/C{0}*100, 0)".format
+if HAS_OPENPYXL:
+    _HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    _SUBHEADER_FILL = PatternFill(start_color="DCE6F1", end_color="DCE6F1", fill_type="solid")
+    _YELLOW_FILL = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+    _GREEN_FILL = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
+    _THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    _BOLD = Font(bold=True)
+    _BOLD12 = Font(bold=True, size=12)
+    _BOLD14 = Font(bold=True, size=14)
+    _SUBHEADER_FONT = Font(bold=True, size=11)
+    _CENTER = Alignment(horizontal='center')
+    # Bordered percentage cell; registered in each workbook so the many
+    # percentage cells share one style instead of setting each attribute
+    _PCT_STYLE = NamedStyle("pct", number_format=_PCT_FMT, border=_THIN_BORDER, font=DEFAULT_FONT)
+
+
 class BadGradeTypesWeight(Exception):
     """Raised when grade type weights don't sum to expected value."""
     pass
@@ -89,18 +133,88 @@ class GradeConfiguration:
         return self.grade_types.get(type_name, 0.0)
 
 
+@functools.lru_cache(maxsize=16)
+def _load_scale_cached(path: str, mtime: float) -> Dict[float, str]:
+    """Parse a letter grade scale file; cached per (path, mtime)."""
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    return data['scale']
+
+
 def load_letter_grade_scale(scale_file: Union[str, Path]) -> Dict[float, str]:
     """Load letter grade scale from YAML file.
     
+    Parsed scales are cached until the file's modification time changes.
+    
     Args:
         scale_file: Path to YAML file with grade scale
         
     Returns:
         Dictionary mapping thresholds to letter grades
     """
-    with open(scale_file, 'r') as f:
-        data = yaml.safe_load(f)
-    return data['scale']
+    path = str(scale_file)
+    # Copy so callers can't mutate the cached scale
+    return dict(_load_scale_cached(path, os.path.getmtime(path)))
+
+
+DEFAULT_SCALE_FILE = Path(__file__).parent.parent / 'MIT-letter-grades.yaml'
+
+# Fallback to hardcoded scale if the default file is not found
+_FALLBACK_SCALE: Dict[float, str] = {
+    0.00: 'F',
+    0.61: 'D-',
+    0.70: 'D',
+    0.74: 'C-',
+    0.77: 'C',
+    0.80: 'C+',
+    0.84: 'B-',
+    0.87: 'B',
+    0.90: 'B+',
+    0.94: 'A-',
+    0.97: 'A',
+    1.00: 'A+',
+}
+
+# A missing or malformed default file must not make the module unimportable
+try:
+    _DEFAULT_SCALE = load_letter_grade_scale(DEFAULT_SCALE_FILE)
+except OSError:
+    _DEFAULT_SCALE = _FALLBACK_SCALE
+except (yaml.YAMLError, ValueError, KeyError, TypeError) as e:
+    print(f"Warning: Could not parse {DEFAULT_SCALE_FILE.name} ({e}); using the built-in scale")
+    _DEFAULT_SCALE = _FALLBACK_SCALE
+
+
+def sort_scale(scale: Dict[float, str]) -> Tuple[Tuple[float, ...], Tuple[str, ...]]:
+    """Split a {threshold: grade} scale into ascending (breakpoints, letters).
+
+    Sort a scale once with this and pass the result to letter_grade_sorted()
+    when grading many students against the same scale.
+    """
+    sorted_items = sorted(scale.items())
+    return tuple(t for t, _ in sorted_items), tuple(g for _, g in sorted_items)
+
+
+_DEFAULT_SORTED_SCALE = sort_scale(_DEFAULT_SCALE)
+
+
+@functools.lru_cache(maxsize=32)
+def _sort_scale_items(items: Tuple[Tuple[float, str], ...]) -> Tuple[Tuple[float, ...], Tuple[str, ...]]:
+    """sort_scale() for a scale given as a tuple of items, cached by content."""
+    return sort_scale(dict(items))
+
+
+def letter_grade_sorted(
+    percentage: float,
+    sorted_scale: Tuple[Tuple[float, ...], Tuple[str, ...]],
+) -> str:
+    """Convert a percentage to a letter grade using a scale from sort_scale()."""
+    breakpoints, letters = sorted_scale
+    # bisect(breakpoints, percentage) returns the insertion point; we want the
+    # grade for the highest threshold <= percentage. Clamping the index also
+    # maps percentages below the lowest threshold to the lowest grade.
+    i = bisect(breakpoints, percentage)
+    return letters[max(0, min(i - 1, len(letters) - 1))]
 
 
 def letter_grade(percentage: float, scale: Optional[Dict[float, str]] = None) -> str:
@@ -109,53 +223,58 @@ def letter_grade(percentage: float, scale: Optional[Dict[float, str]] = None) ->
     Args:
         percentage: Grade as a percentage (0.0 to 1.0)
         scale: Optional custom grading scale as {threshold: grade}
-               If None, loads from MIT-letter-grades.yaml
+               If None, uses the MIT-letter-grades.yaml scale loaded at import
 
     Returns:
         Letter grade string (e.g., 'A', 'B+', 'C-', etc.)
     """
-    if scale is None:
-        # Load default MIT scale
-        scale_path = Path(__file__).parent.parent / 'MIT-letter-grades.yaml'
-        if scale_path.exists():
-            scale = load_letter_grade_scale(scale_path)
-        else:
-            # Fallback to hardcoded scale if file not found
-            scale = {
-                0.00: 'F',
-                0.61: 'D-',
-                0.70: 'D',
-                0.74: 'C-',
-                0.77: 'C',
-                0.80: 'C+',
-                0.84: 'B-',
-                0.87: 'B',
-                0.90: 'B+',
-                0.94: 'A-',
-                0.97: 'A',
-                1.00: 'A+',
-            }
-    
-    # Sort scale by threshold
-    sorted_items = sorted(scale.items())
-    breakpoints = [t for t, _ in sorted_items]
-    letters = [g for _, g in sorted_items]
+    # Custom scales are usually the same few dicts passed again and again:
+    # reuse their sorted breakpoints instead of re-sorting on every call
+    sorted_scale = _DEFAULT_SORTED_SCALE if scale is None else _sort_scale_items(tuple(scale.items()))
+    return letter_grade_sorted(percentage, sorted_scale)
 
-    # Find appropriate grade using bisect
-    # bisect(breakpoints, percentage) returns the insertion point
-    # We want the grade corresponding to the highest threshold <= percentage
-    i = bisect(breakpoints, percentage)
-    
-    # Clamp index to valid range
-    # i can be 0 (below all thresholds) to len(breakpoints) (above all thresholds)
-    # We want index 0 to len(letters)-1
-    index = max(0, min(i - 1, len(letters) - 1))
-    
-    # Special case: if percentage is below the lowest threshold, still use lowest grade
-    if percentage < breakpoints[0]:
-        index = 0
-    
-    return letters[index]
+
+def _mean_stdev(values: List[float]) -> Tuple[float, float]:
+    """Return the mean and sample standard deviation of at least two floats.
+
+    Uses math.fsum rather than the statistics module, whose exact Fraction
+    arithmetic is far slower for plain float data.
+    """
+    n = len(values)
+    mean = math.fsum(values) / n
+    return mean, math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (n - 1))
+
+
+def _drop_and_average(
+    scores: Dict[int, Tuple[float, float]],
+    num_to_drop: int,
+) -> Tuple[List[Tuple[int, Tuple[float, float]]], Optional[Tuple[int, Tuple[float, float]]], float]:
+    """Drop the lowest scores of one grade type and average the rest.
+
+    Args:
+        scores: Assignment ID -> (percentage, points) for one student and type
+        num_to_drop: Number of lowest percentages to drop (only if more remain)
+
+    Returns:
+        (kept, dropped, average): kept items in ascending percentage order,
+        the lowest dropped item or None, and the mean kept percentage
+        (0.0 if nothing is kept)
+    """
+    if len(scores) == 1:
+        # Single-assignment types (exams, projects): nothing to sort or drop
+        ((aid, value),) = scores.items()
+        return [(aid, value)], None, value[0]
+
+    # Reports list kept assignments in ascending order, so a full sort is
+    # needed anyway; partial selection (heapq) would not save work here
+    sorted_items = sorted(scores.items(), key=lambda x: x[1][0])
+    dropped = None
+    if num_to_drop > 0 and len(sorted_items) > num_to_drop:
+        dropped = sorted_items[0]
+        sorted_items = sorted_items[num_to_drop:]
+    if not sorted_items:
+        return sorted_items, dropped, 0.0
+    return sorted_items, dropped, sum(pct for _, (pct, _) in sorted_items) / len(sorted_items)
 
 
 @dataclass
@@ -169,6 +288,11 @@ class GradeTypeResult:
     dropped: Optional[Tuple[str, float, float]] = None  # (name, percentage, points)
 
 
+# Horizontal rules used by ProcessedStudent.format_report
+_REPORT_RULE = "=" * 70
+_ALERT_RULE = "!" * 70
+
+
 @dataclass
 class ProcessedStudent:
     """Student with processed grades and computed final grade."""
@@ -187,76 +311,79 @@ class ProcessedStudent:
 
     def format_report(self, show_anomalies: bool = True, partial_semester: bool = False) -> str:
         """Generate formatted individual grade report."""
-        line = "=" * 70
-        s = f"{line}\n"
-        s += "GRADE REPORT"
+        line = _REPORT_RULE
+        parts = [f"{line}\n", "GRADE REPORT"]
         if partial_semester:
-            s += " (PARTIAL SEMESTER - Based on graded assignments only)"
-        s += "\n"
-        s += f"{line}\n\n"
-        s += f"Student: {self.name}\n"
+            parts.append(" (PARTIAL SEMESTER - Based on graded assignments only)")
+        parts.append("\n")
+        parts.append(f"{line}\n\n")
+        parts.append(f"Student: {self.name}\n")
         if self.email:
-            s += f"Email:   {self.email}\n"
+            parts.append(f"Email:   {self.email}\n")
         if self.mit_id:
-            s += f"MIT ID:  {self.mit_id}\n"
-        s += f"\n{line}\n"
+            parts.append(f"MIT ID:  {self.mit_id}\n")
+        parts.append(f"\n{line}\n")
         
         if partial_semester:
             # Show current grade based on graded work
-            s += f"CURRENT GRADE (on graded work): {self.normalized_percentage*100:.2f}%\n"
-            s += f"LETTER GRADE ACCORDING TO COURSE GRADING SCHEME: {self.letter_grade}\n"
+            parts.append(f"CURRENT GRADE (on graded work): {self.normalized_percentage*100:.2f}%\n")
+            parts.append(f"LETTER GRADE ACCORDING TO COURSE GRADING SCHEME: {self.letter_grade}\n")
             if self.modified_letter_grade:
-                s += f"LETTER GRADE SUBMITTED TO REGISTRAR ACCORDING TO MODIFIED CUTOFFS: {self.modified_letter_grade}\n"
-            s += f"(Graded categories worth {self.weight_normalization_factor*100:.0f}% of course, normalized to 100%)\n"
+                parts.append(f"LETTER GRADE SUBMITTED TO REGISTRAR ACCORDING TO MODIFIED CUTOFFS: {self.modified_letter_grade}\n")
+            parts.append(f"(Graded categories worth {self.weight_normalization_factor*100:.0f}% of course, normalized to 100%)\n")
         else:
-            s += f"OVERALL GRADE: {self.normalized_percentage*100:.2f}%\n"
-            s += f"LETTER GRADE ACCORDING TO COURSE GRADING SCHEME: {self.letter_grade}\n"
+            parts.append(f"OVERALL GRADE: {self.normalized_percentage*100:.2f}%\n")
+            parts.append(f"LETTER GRADE ACCORDING TO COURSE GRADING SCHEME: {self.letter_grade}\n")
             if self.modified_letter_grade:
-                s += f"LETTER GRADE SUBMITTED TO REGISTRAR ACCORDING TO MODIFIED CUTOFFS: {self.modified_letter_grade}\n"
+                parts.append(f"LETTER GRADE SUBMITTED TO REGISTRAR ACCORDING TO MODIFIED CUTOFFS: {self.modified_letter_grade}\n")
         
-        s += f"{line}\n\n"
+        parts.append(f"{line}\n\n")
 
         # Grade breakdown by type
         for type_name, result in self.grade_types.items():
-            s += f"{type_name.upper()}\n"
-            s += f"{'-' * len(type_name)}\n"
+            parts.append(f"{type_name.upper()}\n")
+            parts.append(f"{'-' * len(type_name)}\n")
 
             # Individual assignments
             for assgn_name, (pct, pts) in result.assignments.items():
-                clean_name = assgn_name.split('(')[0].strip()
-                s += f"  {clean_name:45s} {pct*100:6.2f}%  ({pts:.2f} pts)\n"
+                clean_name = display_name(assgn_name)
+                parts.append(f"  {clean_name:45s} {pct*100:6.2f}%  ({pts:.2f} pts)\n")
 
             # Summary for this type
-            s += f"\n  Average across {result.num_assignments} assignment(s): "
-            s += f"{result.average_percentage*100:.2f}%\n"
+            parts.append(f"\n  Average across {result.num_assignments} assignment(s): ")
+            parts.append(f"{result.average_percentage*100:.2f}%\n")
             
             # Show the weighted contribution (performance × category weight)
-            s += f"  Weighted contribution: {result.contribution_to_total*100:.2f}%\n"
+            parts.append(f"  Weighted contribution: {result.contribution_to_total*100:.2f}%\n")
             
             if partial_semester:
                 # Also show what this represents as % of current graded work
                 normalized_contribution = result.contribution_to_total / self.weight_normalization_factor
-                s += f"  As % of graded work: {normalized_contribution*100:.2f}%\n"
+                parts.append(f"  As % of graded work: {normalized_contribution*100:.2f}%\n")
 
             # Show dropped grade if any
             if result.dropped:
                 dropped_name, dropped_pct, dropped_pts = result.dropped
-                clean_name = dropped_name.split('(')[0].strip()
-                s += f"  ** Lowest grade dropped: {clean_name} "
-                s += f"({dropped_pct*100:.2f}%, {dropped_pts:.2f} pts)\n"
+                clean_name = display_name(dropped_name)
+                parts.append(f"  ** Lowest grade dropped: {clean_name} ")
+                parts.append(f"({dropped_pct*100:.2f}%, {dropped_pts:.2f} pts)\n")
 
-            s += "\n"
+            parts.append("\n")
 
         # Display anomalies if any
         if show_anomalies and self.anomalies:
-            s += f"\n{'!' * 70}\n"
-            s += "GRADE PATTERN ALERTS\n"
-            s += f"{'!' * 70}\n"
+            parts.append(f"\n{_ALERT_RULE}\n")
+            parts.append("GRADE PATTERN ALERTS\n")
+            parts.append(f"{_ALERT_RULE}\n")
             for anomaly in self.anomalies:
-                s += f"  ⚠ {anomaly}\n"
-            s += f"{'!' * 70}\n"
+                parts.append(f"  ⚠ {anomaly}\n")
+            parts.append(f"{_ALERT_RULE}\n")
+
+        return "".join(parts)
 
-        return s
+
+# (student, filename, partial_semester, formulas, breakdown) for one Excel report
+_ExcelJob = Tuple[ProcessedStudent, Path, bool, bool, bool]
 
 
 class GradeProcessor:
@@ -284,6 +411,12 @@ class GradeProcessor:
         """
         self.gradebook = gradebook
         self.processed_students: Dict[Any, ProcessedStudent] = {}
+
+        # Set by process_grades(); None/0.0 until it has run
+        self._graded_assignments: Optional[set[int]] = None
+        self._active_weight_total: float = 0.0
+        self._weight_normalization: float = 0.0
+        self._assignment_groups: Optional[List[Any]] = None
         
         # Load letter grade scale
         if letter_grade_scale is None:
@@ -301,6 +434,20 @@ class GradeProcessor:
         else:
             self.modified_grade_scale = load_letter_grade_scale(modified_grade_scale)
 
+        # Sort each scale once rather than on every letter_grade() call
+        self._letter_scale_sorted = (
+            _DEFAULT_SORTED_SCALE if self.letter_grade_scale is None
+            else sort_scale(self.letter_grade_scale)
+        )
+        self._modified_scale_sorted = (
+            sort_scale(self.modified_grade_scale) if self.modified_grade_scale else None
+        )
+        # Ascending (threshold, letter) rows for the Excel conversion sheets
+        self._letter_sheet_rows = tuple(sorted((self.letter_grade_scale or _CONVERSION_SHEET_SCALE).items()))
+        self._modified_sheet_rows = (
+            tuple(sorted(self.modified_grade_scale.items())) if self.modified_grade_scale else None
+        )
+
         # Build configuration from Canvas assignment groups or use provided config
         if assignment_groups is not None:
             self._init_from_canvas_groups(assignment_groups)
@@ -310,6 +457,21 @@ class GradeProcessor:
         else:
             raise ValueError("Either grade_config or assignment_groups must be provided")
 
+        # Invert the assignment -> type map once: for each type, its
+        # (assignment ID, points possible) pairs, walked per student
+        self._type_to_aids: Dict[str, List[Tuple[int, float]]] = {}
+        for aid, type_name in self._assignment_to_type.items():
+            if type_name and aid in self.gradebook.assignments:
+                points_possible = self.gradebook.assignments[aid].points_possible or 0.0
+                self._type_to_aids.setdefault(type_name, []).append((aid, points_possible))
+
+        # Per-student {aid: (percentage, points)}, filled on first use and
+        # reused by later process_grades() runs (e.g. other drop_lowest rules)
+        self._pct_cache: Dict[Any, Dict[int, Tuple[float, float]]] = {}
+
+        # Category weights (0-100) by type name, filled by _get_category_weight()
+        self._weight_cache: Dict[str, float] = {}
+
     def _init_from_canvas_groups(self, assignment_groups: List[Any]) -> None:
         """Initialize configuration from Canvas assignment groups.
         
@@ -350,16 +512,17 @@ class GradeProcessor:
         Returns:
             Set of assignment IDs that have been graded
         """
-        graded = set()
-        for aid in self.gradebook.assignments.keys():
-            # Check if any student has a non-zero score for this assignment
-            for student in self.gradebook.get_students():
-                score_obj = student.scores.get(aid)
-                if score_obj and not score_obj.excused:
-                    if score_obj.score is not None and score_obj.score > 0:
-                        graded.add(aid)
-                        break
-        return graded
+        # any() stops at the first student with a score, so graded
+        # assignments cost one or two lookups; only ungraded ones scan everyone
+        students = list(self.gradebook.students.values())
+        return {
+            aid for aid in self.gradebook.assignments
+            if any(
+                (sc := st.scores.get(aid)) is not None
+                and not sc.excused and sc.score is not None and sc.score > 0
+                for st in students
+            )
+        }
     
     def _calculate_graded_category_weights(self) -> None:
         """Calculate which categories have graded work and their weights.
@@ -436,6 +599,8 @@ class GradeProcessor:
             processed = self._process_student(student, drop_lowest)
             self.processed_students[student.id] = processed
 
+        self._assign_letter_grades(self.processed_students.values())
+
         # Anomaly detection
         if detect_anomalies:
             self._detect_anomalies()
@@ -455,53 +620,36 @@ class GradeProcessor:
 
         # Group assignments by type (only graded assignments)
         assignments_by_type: Dict[str, Dict[int, Tuple[float, float]]] = {}
-        for aid, score in student.scores.items():
-            # Skip if not in graded assignments
-            if not hasattr(self, '_graded_assignments') or aid not in self._graded_assignments:
-                continue
-                
-            if score.excused:
-                continue
-            
-            type_name = self._assignment_to_type.get(aid)
-            if not type_name:
-                continue
-
-            if type_name not in assignments_by_type:
-                assignments_by_type[type_name] = {}
-
-            # Get percentage and points
-            if score.score is not None and score.points_possible and score.points_possible > 0:
-                pct = score.score / score.points_possible
-                pts = score.score
-            else:
-                pct = 0.0
-                pts = 0.0
-
-            assignments_by_type[type_name][aid] = (pct, pts)
+        # Loop invariants hoisted into locals; before process_grades() has
+        # run, no assignment counts as graded
+        gb_assignments = self.gradebook.assignments
+        graded = self._graded_assignments
+        aids_by_type = self._type_to_aids if graded is not None else {}
+        pcts = self._score_percentages(student)
+        for type_name, aids in aids_by_type.items():
+            # Only graded, non-excused assignments with a submission
+            type_scores = {
+                aid: pcts[aid] for aid, _ in aids
+                if aid in graded and aid in pcts
+            }
+            if type_scores:
+                assignments_by_type[type_name] = type_scores
 
         # Process each grade type
         for type_name, assignments in assignments_by_type.items():
-            # Sort by score (for dropping lowest)
-            sorted_items = sorted(assignments.items(), key=lambda x: x[1][0])
-            
-            # Drop lowest if requested
-            num_to_drop = drop_lowest.get(type_name, 0)
+            # Drop lowest if requested, then average what is left
+            sorted_items, lowest, avg_pct = _drop_and_average(
+                assignments, drop_lowest.get(type_name, 0)
+            )
             dropped = None
-            if num_to_drop > 0 and len(sorted_items) > num_to_drop:
+            if lowest is not None:
                 # Keep dropped info
-                dropped_aid, (dropped_pct, dropped_pts) = sorted_items[0]
-                dropped_name = self.gradebook.assignments[dropped_aid].name
+                dropped_aid, (dropped_pct, dropped_pts) = lowest
+                dropped_name = gb_assignments[dropped_aid].name
                 dropped = (dropped_name, dropped_pct, dropped_pts)
-                
-                # Remove lowest
-                sorted_items = sorted_items[num_to_drop:]
 
-            # Compute average and contribution
+            # Compute contribution
             if sorted_items:
-                total_pct = sum(pct for _, (pct, _) in sorted_items)
-                avg_pct = total_pct / len(sorted_items)
-                
                 # Use the full category weight (no proportional scaling)
                 weight = self.config.weight_for_type(type_name)
                     
@@ -510,7 +658,7 @@ class GradeProcessor:
                 # Build assignment dict with names
                 assgn_dict = {}
                 for aid, (pct, pts) in sorted_items:
-                    name = self.gradebook.assignments[aid].name
+                    name = gb_assignments[aid].name
                     assgn_dict[name] = (pct, pts)
 
                 result = GradeTypeResult(
@@ -524,9 +672,9 @@ class GradeProcessor:
                 processed.grade_types[type_name] = result
                 processed.final_percentage += contribution
 
-        # Normalize and compute letter grade
+        # Normalize (letter grades are set in _assign_letter_grades, for all students at once)
         # For partial semester, normalize by the total partial weight
-        if hasattr(self, '_weight_normalization') and self._weight_normalization > 0:
+        if self._weight_normalization > 0:
             processed.normalized_percentage = processed.final_percentage / self._weight_normalization
             processed.weight_normalization_factor = self._weight_normalization
         elif self.config.total_weight > 0:
@@ -536,20 +684,46 @@ class GradeProcessor:
             processed.normalized_percentage = 0.0
             processed.weight_normalization_factor = 1.0
 
-        processed.letter_grade = letter_grade(
-            processed.normalized_percentage,
-            scale=self.letter_grade_scale
-        )
-        
-        # Compute modified letter grade if modified scale is provided
-        if self.modified_grade_scale:
-            processed.modified_letter_grade = letter_grade(
-                processed.normalized_percentage,
-                scale=self.modified_grade_scale
-            )
-
         return processed
 
+    def _assign_letter_grades(self, students: Iterable[ProcessedStudent]) -> None:
+        """Set letter_grade (and modified_letter_grade, if a modified scale is
+        configured) from each student's normalized percentage.
+
+        Uses the scales sorted once per GradeProcessor, so the batch does no
+        per-student sorting.
+        """
+        to_letter = letter_grade_sorted
+        scale = self._letter_scale_sorted
+        modified_scale = self._modified_scale_sorted
+        for student in students:
+            pct = student.normalized_percentage
+            student.letter_grade = to_letter(pct, scale)
+            if modified_scale:
+                student.modified_letter_grade = to_letter(pct, modified_scale)
+
+    def _score_percentages(self, student: StudentSummary) -> Dict[int, Tuple[float, float]]:
+        """Return {aid: (percentage, points)} for the student's non-excused typed scores.
+
+        Computed once per student and cached; ungraded scores or assignments
+        without points count as (0.0, 0.0).
+        """
+        pcts = self._pct_cache.get(student.id)
+        if pcts is None:
+            pcts = {}
+            scores = student.scores
+            for aids in self._type_to_aids.values():
+                for aid, points_possible in aids:
+                    score = scores.get(aid)
+                    if score is None or score.excused:
+                        continue
+                    if score.score is not None and points_possible > 0:
+                        pcts[aid] = (score.score / points_possible, score.score)
+                    else:
+                        pcts[aid] = (0.0, 0.0)
+            self._pct_cache[student.id] = pcts
+        return pcts
+
     def _detect_anomalies(self) -> None:
         """Detect anomalous grade patterns.
 
@@ -567,10 +741,8 @@ class GradeProcessor:
                     percentages.append(student.grade_types[type_name].average_percentage)
 
             if len(percentages) >= 2:
-                type_stats[type_name] = {
-                    'mean': statistics.mean(percentages),
-                    'stdev': statistics.stdev(percentages),
-                }
+                mean, stdev = _mean_stdev(percentages)
+                type_stats[type_name] = {'mean': mean, 'stdev': stdev}
 
         # Check each student
         for student in self.processed_students.values():
@@ -581,27 +753,21 @@ class GradeProcessor:
             }
 
             if len(type_percentages) >= 2:
-                for type1, pct1 in type_percentages.items():
-                    for type2, pct2 in type_percentages.items():
-                        if type1 >= type2:
-                            continue
-                        gap = abs(pct1 - pct2)
-                        if max(pct1, pct2) > 0.90 and gap > 0.20:
-                            high_type = type1 if pct1 > pct2 else type2
-                            low_type = type2 if pct1 > pct2 else type1
-                            high_pct = max(pct1, pct2)
-                            low_pct = min(pct1, pct2)
-                            student.anomalies.append(
-                                f"{high_type} avg is {high_pct*100:.1f}% but "
-                                f"{low_type} avg is only {low_pct*100:.1f}% (gap: {gap*100:.1f}%)"
-                            )
+                # Any qualifying pair implies the highest/lowest pair qualifies,
+                # so report only the widest gap
+                high_type, high_pct = max(type_percentages.items(), key=lambda x: x[1])
+                low_type, low_pct = min(type_percentages.items(), key=lambda x: x[1])
+                gap = high_pct - low_pct
+                if high_pct > 0.90 and gap > 0.20:
+                    student.anomalies.append(
+                        f"{high_type} avg is {high_pct*100:.1f}% but "
+                        f"{low_type} avg is only {low_pct*100:.1f}% (gap: {gap*100:.1f}%)"
+                    )
 
             # Check 2: High variance within a type
             for type_name, result in student.grade_types.items():
                 if result.num_assignments >= 3:
-                    percentages = [pct for pct, _ in result.assignments.values()]
-                    variance = statistics.stdev(percentages)
-                    mean = statistics.mean(percentages)
+                    mean, variance = _mean_stdev([pct for pct, _ in result.assignments.values()])
 
                     if variance > 0.20 and mean > 0.30:
                         student.anomalies.append(
@@ -611,10 +777,12 @@ class GradeProcessor:
 
             # Check 3: Statistical outliers
             for type_name, result in student.grade_types.items():
+                if result.average_percentage <= 0.95:
+                    continue  # can't be flagged; skip the z-score
                 if type_name in type_stats and type_stats[type_name]['stdev'] > 0:
                     stats = type_stats[type_name]
                     z_score = (result.average_percentage - stats['mean']) / stats['stdev']
-                    if z_score > 2.0 and result.average_percentage > 0.95:
+                    if z_score > 2.0:
                         student.anomalies.append(
                             f"Statistical outlier in {type_name}: "
                             f"{result.average_percentage*100:.1f}% "
@@ -661,17 +829,15 @@ class GradeProcessor:
         print("GRADE SUMMARY")
         print("=" * 70)
         print(f"Total students: {len(students)}")
-        print(f"Mean: {statistics.mean(percentages)*100:.2f}%")
+        print(f"Mean: {math.fsum(percentages) / len(percentages)*100:.2f}%")
         print(f"Median: {statistics.median(percentages)*100:.2f}%")
         if len(percentages) > 1:
-            print(f"Std Dev: {statistics.stdev(percentages)*100:.2f}%")
+            print(f"Std Dev: {_mean_stdev(percentages)[1]*100:.2f}%")
         print(f"Min: {min(percentages)*100:.2f}%")
         print(f"Max: {max(percentages)*100:.2f}%")
 
         # Letter grade distribution
-        letter_counts: Dict[str, int] = {}
-        for s in students:
-            letter_counts[s.letter_grade] = letter_counts.get(s.letter_grade, 0) + 1
+        letter_counts = Counter(s.letter_grade for s in students)
 
         print("\nLetter Grade Distribution:")
         for letter in ['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D', 'D-', 'F']:
@@ -686,402 +852,467 @@ class GradeProcessor:
 
         print("=" * 70)
 
-    def save_individual_reports(self, directory: str = 'individual-grades', include_excel: bool = True) -> None:
+    def save_individual_reports(
+        self,
+        directory: str = 'individual-grades',
+        include_excel: bool = True,
+        formulas: bool = True,
+        breakdown: bool = False
+    ) -> None:
         """Save individual student reports to files.
         
         Args:
             directory: Directory to save reports
             include_excel: If True, also create Excel files with formulas
+            formulas: If False, Excel files hold computed values and letter
+                grades instead of formulas and grade conversion sheets
+            breakdown: With formulas=False, keep the average, weight and
+                contribution rows for each category instead of one
+                weighted contribution row
         """
         dir_path = Path(directory)
         dir_path.mkdir(exist_ok=True)
 
-        # Clean existing files
-        for f in dir_path.glob('*.txt'):
-            f.unlink()
-        if include_excel:
-            for f in dir_path.glob('*.xlsx'):
-                f.unlink()
+        # Clean existing files (one directory scan for both extensions)
+        suffixes = ('.txt', '.xlsx') if include_excel else ('.txt',)
+        with os.scandir(dir_path) as entries:
+            stale = [e.path for e in entries if e.name.endswith(suffixes) and e.is_file()]
+        for path in stale:
+            os.unlink(path)
 
         # Check if this is partial semester grading
-        partial = hasattr(self, '_graded_assignments')
+        partial = self._graded_assignments is not None
 
-        for student in self.processed_students.values():
-            # Save text report
-            filename = dir_path / f"{student.name}.txt"
-            filename.write_text(student.format_report(partial_semester=partial), encoding='utf-8')
-            
-            # Save Excel report if requested and library available
-            if include_excel and HAS_OPENPYXL:
-                excel_filename = dir_path / f"{student.name}.xlsx"
-                self._save_student_excel(student, excel_filename, partial)
+        # Reports are formatted here; the text file writes go to a thread pool
+        excel_jobs: List[_ExcelJob] = []
+        with ThreadPoolExecutor(max_workers=REPORT_WRITE_WORKERS) as pool:
+            writes = []
+            for student in self.processed_students.values():
+                # Save text report
+                filename = dir_path / f"{student.name}.txt"
+                report = student.format_report(partial_semester=partial)
+                writes.append(pool.submit(filename.write_text, report, encoding='utf-8'))
+                
+                # Queue Excel report if requested and library available
+                if include_excel and HAS_OPENPYXL:
+                    excel_filename = dir_path / f"{student.name}.xlsx"
+                    excel_jobs.append((student, excel_filename, partial, formulas, breakdown))
+
+            for write in writes:
+                write.result()  # re-raise any write error
+
+        # Only once the writer threads have exited: the Excel process pool
+        # forks, and forking a process with live threads can deadlock
+        self._save_excel_reports(excel_jobs)
 
         report_types = "text and Excel" if (include_excel and HAS_OPENPYXL) else "text"
         print(f"Saved {len(self.processed_students)} individual {report_types} reports to {directory}/")
 
-    def _save_student_excel(self, student: ProcessedStudent, filename: Path, partial_semester: bool) -> None:
-        """Create an Excel file with student grades and formulas.
+    def _save_excel_reports(self, jobs: List[_ExcelJob]) -> None:
+        """Write Excel reports, spreading them over worker processes for large classes.
+
+        Workbook construction in openpyxl is CPU-bound pure Python, so
+        separate processes scale where threads would not.
         
         Args:
-            student: ProcessedStudent object
-            filename: Path to save Excel file
-            partial_semester: Whether this is partial semester grading
+            jobs: (student, filename, partial_semester, formulas, breakdown)
+                for each report
         """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Grade Report"
+        context = self._report_context(job[0] for job in jobs)
+        if len(jobs) >= PARALLEL_EXCEL_MIN_REPORTS and (os.cpu_count() or 1) > 1:
+            try:
+                # Workers get the small report context once, not the processor
+                with ProcessPoolExecutor(initializer=_init_excel_worker, initargs=(context,)) as pool:
+                    list(pool.map(_save_excel_in_worker, jobs, chunksize=8))
+                return
+            except (BrokenProcessPool, pickle.PicklingError):
+                # e.g. a worker process that could not be started
+                pass
+        for job in jobs:
+            _write_student_report(context, *job)
+
+    def _report_context(self, students: Iterable[ProcessedStudent]) -> _ReportContext:
+        """Collect what the Excel writer needs for the given students.
         
-        # Styles
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        subheader_fill = PatternFill(start_color="DCE6F1", end_color="DCE6F1", fill_type="solid")
-        subheader_font = Font(bold=True, size=11)
-        bold_font = Font(bold=True)
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        Args:
+            students: Students whose reports will be written
+            
+        Returns:
+            _ReportContext with points by assignment name, weights for every
+            grade type the students have, and the letter grade scales
+        """
+        type_names = {type_name for student in students for type_name in student.grade_types}
+        return _ReportContext(
+            points_by_name={
+                name: a.points_possible for name, a in self.gradebook.assignments_by_name.items()
+            },
+            category_weights={type_name: self._get_category_weight(type_name) for type_name in type_names},
+            letter_sheet_rows=self._letter_sheet_rows,
+            modified_sheet_rows=self._modified_sheet_rows,
         )
+
+    def _get_category_weight(self, type_name: str) -> float:
+        """Get the weight for a category as a percentage (0-100).
+
+        Weights are fixed once the processor is configured, so each type is
+        resolved once and then served from ``self._weight_cache``.
+        """
+        weight = self._weight_cache.get(type_name)
+        if weight is not None:
+            return weight
+        # Try config first (both Canvas and manual config)
+        if self.config:
+            weight = self.config.weight_for_type(type_name) * 100
+        # Fallback to assignment groups if stored
+        elif self._assignment_groups is not None:
+            weight = next(
+                (getattr(group, 'group_weight', 0.0) for group in self._assignment_groups
+                 if getattr(group, 'name', None) == type_name),
+                0.0
+            )
+        else:
+            weight = 0.0
+        self._weight_cache[type_name] = weight
+        return weight
+
+
+# -------------------- Excel helpers --------------------
+# Scale for the "Grades" sheet when the processor has no letter grade scale
+_CONVERSION_SHEET_SCALE: Dict[float, str] = {
+    0.00: 'F',
+    0.61: 'D',
+    0.70: 'C-',
+    0.74: 'C',
+    0.77: 'C+',
+    0.80: 'B-',
+    0.84: 'B',
+    0.87: 'B+',
+    0.90: 'A-',
+    0.94: 'A',
+    0.97: 'A+'
+}
+
+
+@dataclass(frozen=True)
+class _ReportContext:
+    """The GradeProcessor state a student Excel report reads.
+
+    Plain dicts and tuples only, so it pickles cheaply for worker processes
+    instead of sending the whole processor and gradebook.
+    """
+    points_by_name: Dict[str, Optional[float]]  # assignment name -> points possible
+    category_weights: Dict[str, float]  # type name -> weight (0-100)
+    # Ascending (threshold, letter) conversion sheet rows; None without a modified scale
+    letter_sheet_rows: Tuple[Tuple[float, str], ...]
+    modified_sheet_rows: Optional[Tuple[Tuple[float, str], ...]]
+
+
+def _styled_cell(ws: Any, value: Any = None, **styles: Any) -> Any:
+    """Create a write-only cell with the given style attributes.
+
+    Args:
+        ws: Write-only worksheet the cell belongs to
+        value: Cell value (formulas are strings starting with ``=``)
+        **styles: Cell attributes such as ``style`` (a named style; pass it
+            first so later attributes override it), ``font``, ``fill``,
+            ``border``, ``alignment`` or ``number_format``
+
+    Returns:
+        WriteOnlyCell ready to be passed to ``ws.append``
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    for name, style in styles.items():
+        setattr(cell, name, style)
+    return cell
+
+
+def _label_row(ws: Any, label: str, value: Any, label_font: Any = None, **value_styles: Any) -> List[Any]:
+    """Build a report row with a bold label in column A and a value in column D.
+
+    Args:
+        ws: Write-only worksheet the row belongs to
+        label: Text for column A
+        value: Number or formula for column D
+        label_font: Font for the label (bold by default)
+        **value_styles: Extra style attributes for the value cell, applied
+            on top of the bordered percentage style
+
+    Returns:
+        Row list ready to be passed to ``ws.append``
+    """
+    return [
+        _styled_cell(ws, label, font=label_font or _BOLD),
+        None,
+        None,
+        _styled_cell(ws, value, style=_PCT_STYLE.name, **value_styles),
+    ]
+
+
+def _write_conversion_sheet(wb: Any, title: str, rows: Iterable[Tuple[float, str]]) -> None:
+    """Append a letter grade conversion table sheet to a write-only workbook.
+
+    Args:
+        wb: Write-only workbook to add the sheet to
+        title: Sheet name referenced by the VLOOKUP formulas
+        rows: (minimum percentage, letter grade) pairs, already sorted
+            ascending as VLOOKUP with TRUE (approximate match) requires
+    """
+    ws = wb.create_sheet(title)
+    ws.column_dimensions['A'].width = 18
+    ws.column_dimensions['B'].width = 15
+    
+    # Header
+    ws.append([_styled_cell(ws, "Min Percentage", font=_BOLD),
+               _styled_cell(ws, "Letter Grade", font=_BOLD)])
+    
+    for threshold, letter in rows:
+        # Store as decimal (0.93 for 93%)
+        ws.append([_styled_cell(ws, threshold, number_format='0.00%'), letter])
+
+
+def _write_student_report(
+    context: _ReportContext,
+    student: ProcessedStudent,
+    filename: Path,
+    partial_semester: bool,
+    formulas: bool = True,
+    breakdown: bool = False
+) -> None:
+    """Create an Excel file with student grades and formulas.
+    
+    The workbook is built in openpyxl's write-only mode, so rows are
+    appended top to bottom and every row number referenced by a formula
+    is worked out before the row is written. Everything needed from the
+    GradeProcessor comes in through ``context``, so this runs unchanged in
+    a worker process.
+    
+    Args:
+        context: Assignment points, category weights and scales for the report
+        student: ProcessedStudent object
+        filename: Path to save Excel file
+        partial_semester: Whether this is partial semester grading
+        formulas: If True, letter grades are VLOOKUPs into conversion
+            sheets, so they follow the live percentage when a student edits
+            a score. If False, write computed numbers and letter grades
+            instead (nothing for Excel to recalculate on open). Each category
+            then gets a single weighted contribution row unless ``breakdown``
+        breakdown: With formulas=False, keep the average, weight and
+            contribution rows for each category
+    """
+    wb = Workbook(write_only=True)
+    wb.add_named_style(_PCT_STYLE)
+    ws = wb.create_sheet("Grade Report")
+    
+    # Column widths must be set before the first row is written
+    ws.column_dimensions['A'].width = 40
+    ws.column_dimensions['B'].width = 12
+    ws.column_dimensions['C'].width = 12
+    ws.column_dimensions['D'].width = 15
+    ws.column_dimensions['E'].width = 15
+    if context.modified_sheet_rows:
+        ws.column_dimensions['F'].width = 18
+        ws.column_dimensions['G'].width = 15
+    
+    # Work out the layout up front: the summary row near the top refers
+    # to the final grade row at the bottom.
+    grade_summary_row = 4 + bool(student.email) + bool(student.mit_id)
+    row = grade_summary_row + 2
+    # Formulas need the average and weight cells; computed values can go
+    # straight to one weighted contribution row per category
+    full_breakdown = formulas or breakdown
+    num_summary_rows = 3 if full_breakdown else 1
+    sections = []
+    for type_name, result in student.grade_types.items():
+        # Assignments, followed by the dropped one if it isn't listed
+        dropped_name = result.dropped[0] if result.dropped else None
+        rows = list(result.assignments.items())
+        # Check if it's already in assignments (shouldn't be)
+        if result.dropped and dropped_name not in result.assignments:
+            rows.append((dropped_name, result.dropped[1:]))
         
-        row = 1
+        assignment_rows = []
+        for assignment_name, (percentage, points) in rows:
+            is_dropped = assignment_name == dropped_name
+            # Look up max points from gradebook
+            max_points = context.points_by_name.get(assignment_name)
+            
+            # Fallback if not found: calculate from percentage (percentage is 0-1, not 0-100)
+            if max_points is None or max_points == 0:
+                max_points = points / percentage if percentage > 0 else 0
+            assignment_rows.append((assignment_name, points, max_points, is_dropped))
         
-        # Title
-        ws.merge_cells(f'A{row}:E{row}')
-        cell = ws[f'A{row}']
-        cell.value = "GRADE REPORT"
+        sections.append((type_name, assignment_rows, context.category_weights[type_name]))
+        # header + table header + assignments + summary rows + blank
+        row += len(assignment_rows) + 3 + num_summary_rows
+    raw_total_row = row
+    normalization_row = raw_total_row + 1
+    current_grade_row = raw_total_row + 1 + partial_semester
+    
+    if not formulas:
+        # Evaluate what the formulas would: percentages, the average of
+        # included rows, each contribution, the total and the final grade
+        section_values = []
+        for type_name, assignment_rows, category_weight in sections:
+            pcts = [points / max_points * 100 if max_points > 0 else 0
+                    for _, points, max_points, _ in assignment_rows]
+            included = [pct for pct, (*_, is_dropped) in zip(pcts, assignment_rows) if not is_dropped]
+            average = math.fsum(included) / len(included) if included else 0.0
+            section_values.append((pcts, average, average * category_weight / 10000))
+        raw_total = math.fsum(contribution for *_, contribution in section_values)
         if partial_semester:
-            cell.value += " (PARTIAL SEMESTER)"
-        cell.font = Font(bold=True, size=14)
-        cell.alignment = Alignment(horizontal='center')
-        row += 1
+            normalization = student.weight_normalization_factor
+            final_grade = raw_total / normalization if normalization else 0.0
+        else:
+            final_grade = raw_total
+    
+    # Title
+    title = "GRADE REPORT"
+    if partial_semester:
+        title += " (PARTIAL SEMESTER)"
+    ws.merged_cells.add(CellRange(min_col=1, min_row=1, max_col=5, max_row=1))
+    ws.append([_styled_cell(ws, title, font=_BOLD14,
+                            alignment=_CENTER)])
+    
+    # Student info
+    ws.append([_styled_cell(ws, "Student:", font=_BOLD), student.name])
+    if student.email:
+        ws.append([_styled_cell(ws, "Email:", font=_BOLD), student.email])
+    if student.mit_id:
+        ws.append([_styled_cell(ws, "MIT ID:", font=_BOLD), student.mit_id])
+    ws.append([])
+    
+    # Overall grade summary row, pointing at the final grade row
+    summary_label = "CURRENT GRADE (on graded work):" if partial_semester else "FINAL GRADE:"
+    if formulas:
+        letter = f'=VLOOKUP(D{grade_summary_row},Grades!A:B,2,TRUE)'
+        modified_letter = f'=VLOOKUP(D{grade_summary_row},ModifiedGrades!A:B,2,TRUE)'
+    else:
+        letter = student.letter_grade
+        modified_letter = student.modified_letter_grade
+    summary = [
+        _styled_cell(ws, summary_label, font=_BOLD12, fill=_SUBHEADER_FILL),
+        None,
+        None,
+        _styled_cell(ws, f'=D{current_grade_row}' if formulas else final_grade,
+                     font=_BOLD12, fill=_SUBHEADER_FILL, number_format=_PCT_FMT),
+        _styled_cell(ws, letter, font=_BOLD12, fill=_SUBHEADER_FILL),
+    ]
+    # Add modified letter grade if modified scale is provided
+    if context.modified_sheet_rows:
+        summary.append(_styled_cell(ws, "Modified Grade:", font=_BOLD12,
+                                    fill=_SUBHEADER_FILL))
+        summary.append(_styled_cell(ws, modified_letter, font=_BOLD12,
+                                    fill=_SUBHEADER_FILL))
+    ws.append(summary)
+    ws.append([])
+    
+    row = grade_summary_row + 2
+    # Track row numbers for formula references
+    category_contribution_rows = {}
+    
+    # For each grade type
+    for index, (type_name, assignment_rows, category_weight) in enumerate(sections):
+        if not formulas:
+            pcts, average, contribution = section_values[index]
         
-        # Student info
-        ws[f'A{row}'] = "Student:"
-        ws[f'B{row}'] = student.name
-        ws[f'A{row}'].font = bold_font
+        # Category header
+        ws.merged_cells.add(CellRange(min_col=1, min_row=row, max_col=5, max_row=row))
+        ws.append([_styled_cell(ws, type_name.upper(), font=_SUBHEADER_FONT, fill=_SUBHEADER_FILL)])
         row += 1
         
-        if student.email:
-            ws[f'A{row}'] = "Email:"
-            ws[f'B{row}'] = student.email
-            ws[f'A{row}'].font = bold_font
-            row += 1
-        
-        if student.mit_id:
-            ws[f'A{row}'] = "MIT ID:"
-            ws[f'B{row}'] = student.mit_id
-            ws[f'A{row}'].font = bold_font
-            row += 1
-        
+        # Assignment table headers
+        ws.append([
+            _styled_cell(ws, heading, font=_BOLD, fill=_HEADER_FILL, border=_THIN_BORDER)
+            for heading in ("Assignment", "Score", "Max Points", "Percentage", "Included")
+        ])
         row += 1
         
-        # Overall grade summary header row
-        if partial_semester:
-            ws[f'A{row}'] = "CURRENT GRADE (on graded work):"
-        else:
-            ws[f'A{row}'] = "FINAL GRADE:"
-        ws[f'A{row}'].font = Font(bold=True, size=12)
-        ws[f'A{row}'].fill = subheader_fill
-        
-        # This will be filled with formula later after we know the contribution rows
-        ws[f'D{row}'].font = Font(bold=True, size=12)
-        ws[f'D{row}'].fill = subheader_fill
-        ws[f'D{row}'].number_format = '0.00"%"'
-        
-        ws[f'E{row}'].font = Font(bold=True, size=12)
-        ws[f'E{row}'].fill = subheader_fill
-        
-        grade_summary_row = row
-        row += 2
-        
-        # Track row numbers for formula references
-        category_contribution_rows = {}
+        first_assignment_row = row
         
-        # For each grade type
-        for type_name, result in student.grade_types.items():
-            # Category header
-            ws.merge_cells(f'A{row}:E{row}')
-            cell = ws[f'A{row}']
-            cell.value = type_name.upper()
-            cell.font = subheader_font
-            cell.fill = subheader_fill
-            row += 1
-            
-            # Assignment table headers
-            ws[f'A{row}'] = "Assignment"
-            ws[f'B{row}'] = "Score"
-            ws[f'C{row}'] = "Max Points"
-            ws[f'D{row}'] = "Percentage"
-            ws[f'E{row}'] = "Included"
-            for col in ['A', 'B', 'C', 'D', 'E']:
-                cell = ws[f'{col}{row}']
-                cell.font = bold_font
-                cell.fill = header_fill
-                cell.border = thin_border
-            row += 1
-            
-            first_assignment_row = row
-            
-            # Assignments
-            for assignment_name, (percentage, points) in result.assignments.items():
-                # Look up max points from gradebook
-                max_points = None
-                for aid, assignment in self.gradebook.assignments.items():
-                    if assignment.name == assignment_name:
-                        max_points = assignment.points_possible
-                        break
-                
-                # Fallback if not found: calculate from percentage (percentage is 0-1, not 0-100)
-                if max_points is None or max_points == 0:
-                    max_points = points / percentage if percentage > 0 else 0
-                
-                # Check if this is the dropped assignment
-                is_dropped = (result.dropped and result.dropped[0] == assignment_name)
-                
-                ws[f'A{row}'] = assignment_name
-                ws[f'B{row}'] = points
-                ws[f'C{row}'] = max_points
-                # Formula for percentage
-                ws[f'D{row}'] = f"=IF(C{row}>0, B{row}/C{row}*100, 0)"
-                ws[f'D{row}'].number_format = '0.00"%"'
-                ws[f'E{row}'] = "No (Dropped)" if is_dropped else "Yes"
-                
-                for col in ['A', 'B', 'C', 'D', 'E']:
-                    ws[f'{col}{row}'].border = thin_border
-                
-                row += 1
-            
-            # Check if dropped assignment exists
-            if result.dropped:
-                dropped_name, dropped_pct, dropped_pts = result.dropped
-                # Check if it's already in assignments (shouldn't be)
-                if dropped_name not in result.assignments:
-                    # Look up max points from gradebook
-                    max_points = None
-                    for aid, assignment in self.gradebook.assignments.items():
-                        if assignment.name == dropped_name:
-                            max_points = assignment.points_possible
-                            break
-                    
-                    # Fallback: calculate from percentage (percentage is 0-1)
-                    if max_points is None or max_points == 0:
-                        max_points = dropped_pts / dropped_pct if dropped_pct > 0 else 0
-                    
-                    ws[f'A{row}'] = dropped_name
-                    ws[f'B{row}'] = dropped_pts
-                    ws[f'C{row}'] = max_points
-                    ws[f'D{row}'] = f"=IF(C{row}>0, B{row}/C{row}*100, 0)"
-                    ws[f'D{row}'].number_format = '0.00"%"'
-                    ws[f'E{row}'] = "No (Dropped)"
-                    
-                    for col in ['A', 'B', 'C', 'D', 'E']:
-                        ws[f'{col}{row}'].border = thin_border
-                    
-                    row += 1
-            
-            last_assignment_row = row - 1
-            
-            # Average calculation
-            ws[f'A{row}'] = "Average:"
-            ws[f'A{row}'].font = bold_font
-            
-            # Formula: AVERAGEIF to only include rows where column E = "Yes"
-            ws[f'D{row}'] = f'=AVERAGEIF(E{first_assignment_row}:E{last_assignment_row},"Yes",D{first_assignment_row}:D{last_assignment_row})'
-            ws[f'D{row}'].number_format = '0.00"%"'
-            ws[f'D{row}'].font = bold_font
-            ws[f'D{row}'].border = thin_border
-            
-            average_row = row
+        # Assignments: one bordered row each, percentage in column D
+        for i, (assignment_name, points, max_points, is_dropped) in enumerate(assignment_rows):
+            ws.append([
+                _styled_cell(ws, assignment_name, border=_THIN_BORDER),
+                _styled_cell(ws, points, border=_THIN_BORDER),
+                _styled_cell(ws, max_points, border=_THIN_BORDER),
+                _styled_cell(ws, _PCT_FORMULA(row) if formulas else pcts[i], style=_PCT_STYLE.name),
+                _styled_cell(ws, "No (Dropped)" if is_dropped else "Yes", border=_THIN_BORDER),
+            ])
             row += 1
-            
-            # Category weight and contribution
-            category_weight = self._get_category_weight(type_name)
-            ws[f'A{row}'] = f"Category Weight:"
-            ws[f'A{row}'].font = bold_font
-            ws[f'D{row}'] = category_weight
-            ws[f'D{row}'].number_format = '0.00"%"'
-            ws[f'D{row}'].border = thin_border
-            weight_row = row
-            row += 1
-            
-            ws[f'A{row}'] = f"Contribution to Total:"
-            ws[f'A{row}'].font = bold_font
-            # Formula: average * weight / 100
-            ws[f'D{row}'] = f'=D{average_row}*D{weight_row}/10000'
-            ws[f'D{row}'].number_format = '0.00"%"'
-            ws[f'D{row}'].font = bold_font
-            ws[f'D{row}'].fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-            ws[f'D{row}'].border = thin_border
-            
-            category_contribution_rows[type_name] = row
-            row += 2
         
-        # Raw total calculation (sum of contributions)
-        ws[f'A{row}'] = "TOTAL (weighted sum):"
-        ws[f'A{row}'].font = bold_font
+        last_assignment_row = row - 1
         
-        # Sum all category contributions
-        contribution_cells = [f"D{r}" for r in category_contribution_rows.values()]
-        ws[f'D{row}'] = f'={"+".join(contribution_cells)}'
-        ws[f'D{row}'].number_format = '0.00"%"'
-        ws[f'D{row}'].font = bold_font
-        ws[f'D{row}'].border = thin_border
+        if not full_breakdown:
+            ws.append(_label_row(ws, f"Contribution to Total ({category_weight:g}% weight):",
+                                 contribution, font=_BOLD, fill=_YELLOW_FILL))
+            ws.append([])
+            row += 2
+            continue
         
-        raw_total_row = row
+        # Average calculation
+        # Formula: AVERAGEIF to only include rows where column E = "Yes"
+        if formulas:
+            average = f'=AVERAGEIF(E{first_assignment_row}:E{last_assignment_row},"Yes",D{first_assignment_row}:D{last_assignment_row})'
+        ws.append(_label_row(ws, "Average:", average, font=_BOLD))
+        average_row = row
         row += 1
         
-        # Normalization factor for partial semester
-        if partial_semester:
-            ws[f'A{row}'] = "Normalization factor:"
-            ws[f'A{row}'].font = bold_font
-            ws[f'D{row}'] = student.weight_normalization_factor
-            ws[f'D{row}'].number_format = '0.0000'
-            ws[f'D{row}'].border = thin_border
-            normalization_row = row
-            row += 1
-        
-        # Final normalized grade
-        ws[f'A{row}'] = "CURRENT GRADE:" if partial_semester else "FINAL GRADE:"
-        ws[f'A{row}'].font = Font(bold=True, size=12)
+        # Category weight and contribution
+        ws.append(_label_row(ws, "Category Weight:", category_weight))
+        weight_row = row
+        row += 1
         
-        # Normalized grade formula
+        # Formula: average * weight / 100
+        if formulas:
+            contribution = f'=D{average_row}*D{weight_row}/10000'
+        ws.append(_label_row(ws, "Contribution to Total:", contribution,
+                             font=_BOLD, fill=_YELLOW_FILL))
+        category_contribution_rows[type_name] = row
+        ws.append([])
+        row += 2
+    
+    # Raw total calculation (sum of contributions)
+    contribution_cells = [f"D{r}" for r in category_contribution_rows.values()]
+    ws.append(_label_row(ws, "TOTAL (weighted sum):",
+                         f'={"+".join(contribution_cells)}' if formulas else raw_total,
+                         font=_BOLD))
+    
+    # Normalization factor for partial semester
+    if partial_semester:
+        ws.append(_label_row(ws, "Normalization factor:", student.weight_normalization_factor,
+                             number_format='0.0000'))
+    if formulas:
         if partial_semester:
-            ws[f'D{row}'] = f'=D{raw_total_row}/D{normalization_row}'
+            final_grade = f'=D{raw_total_row}/D{normalization_row}'
         else:
-            ws[f'D{row}'] = f'=D{raw_total_row}'
-        ws[f'D{row}'].number_format = '0.00"%"'
-        ws[f'D{row}'].font = Font(bold=True, size=12)
-        ws[f'D{row}'].fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
-        ws[f'D{row}'].border = thin_border
-        
-        current_grade_row = row
-        
-        # Now fill in the grade summary row with formula reference to current grade
-        ws[f'D{grade_summary_row}'] = f'=D{current_grade_row}'
-        ws[f'D{grade_summary_row}'].number_format = '0.00"%"'
-        
-        # Add letter grade with VLOOKUP to conversion table
-        ws[f'E{grade_summary_row}'] = f'=VLOOKUP(D{grade_summary_row},Grades!A:B,2,TRUE)'
-        
-        # Add modified letter grade if modified scale is provided
-        if self.modified_grade_scale:
-            ws[f'F{grade_summary_row}'] = "Modified Grade:"
-            ws[f'F{grade_summary_row}'].font = Font(bold=True, size=12)
-            ws[f'F{grade_summary_row}'].fill = subheader_fill
-            ws[f'G{grade_summary_row}'] = f'=VLOOKUP(D{grade_summary_row},ModifiedGrades!A:B,2,TRUE)'
-            ws[f'G{grade_summary_row}'].font = Font(bold=True, size=12)
-            ws[f'G{grade_summary_row}'].fill = subheader_fill
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 40
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 15
-        if self.modified_grade_scale:
-            ws.column_dimensions['F'].width = 18
-            ws.column_dimensions['G'].width = 15
-        
+            final_grade = f'=D{raw_total_row}'
+    
+    # Final normalized grade
+    ws.append(_label_row(ws, "CURRENT GRADE:" if partial_semester else "FINAL GRADE:",
+                         final_grade, label_font=_BOLD12, font=_BOLD12, fill=_GREEN_FILL))
+    
+    if formulas:
         # Create letter grade conversion sheet
-        self._add_grade_conversion_sheet(wb)
+        _write_conversion_sheet(wb, "Grades", context.letter_sheet_rows)
         
         # Create modified grade conversion sheet if provided
-        if self.modified_grade_scale:
-            self._add_modified_grade_conversion_sheet(wb)
-        
-        # Save workbook
-        wb.save(filename)
-    
-    def _add_grade_conversion_sheet(self, wb: Workbook) -> None:
-        """Add a sheet with letter grade conversion table.
-        
-        Args:
-            wb: Workbook to add the sheet to
-        """
-        # Create new sheet
-        ws = wb.create_sheet("Grades")
-        
-        # Get the letter grade scale
-        if self.letter_grade_scale:
-            scale = self.letter_grade_scale
-        else:
-            # Default MIT scale if none provided
-            scale = {
-                0.00: 'F',
-                0.61: 'D',
-                0.70: 'C-',
-                0.74: 'C',
-                0.77: 'C+',
-                0.80: 'B-',
-                0.84: 'B',
-                0.87: 'B+',
-                0.90: 'A-',
-                0.94: 'A',
-                0.97: 'A+'
-            }
-        
-        # Header
-        ws['A1'] = "Min Percentage"
-        ws['B1'] = "Letter Grade"
-        ws['A1'].font = Font(bold=True)
-        ws['B1'].font = Font(bold=True)
-        
-        # IMPORTANT: Sort by percentage ASCENDING for VLOOKUP with TRUE (approximate match)
-        # VLOOKUP with TRUE requires data sorted in ascending order
-        sorted_thresholds = sorted(scale.items(), reverse=False)
-        
-        row = 2
-        for threshold, letter in sorted_thresholds:
-            ws[f'A{row}'] = threshold  # Store as decimal (0.93 for 93%)
-            ws[f'A{row}'].number_format = '0.00%'
-            ws[f'B{row}'] = letter
-            row += 1
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 18
-        ws.column_dimensions['B'].width = 15
+        if context.modified_sheet_rows:
+            _write_conversion_sheet(wb, "ModifiedGrades", context.modified_sheet_rows)
     
-    def _add_modified_grade_conversion_sheet(self, wb: Workbook) -> None:
-        """Add a sheet with modified letter grade conversion table.
-        
-        Args:
-            wb: Workbook to add the sheet to
-        """
-        # Create new sheet
-        ws = wb.create_sheet("ModifiedGrades")
-        
-        # Use the modified grade scale
-        scale = self.modified_grade_scale
-        
-        # Header
-        ws['A1'] = "Min Percentage"
-        ws['B1'] = "Letter Grade"
-        ws['A1'].font = Font(bold=True)
-        ws['B1'].font = Font(bold=True)
-        
-        # Sort by percentage ASCENDING for VLOOKUP with TRUE (approximate match)
-        sorted_thresholds = sorted(scale.items(), reverse=False)
-        
-        row = 2
-        for threshold, letter in sorted_thresholds:
-            ws[f'A{row}'] = threshold  # Store as decimal (0.93 for 93%)
-            ws[f'A{row}'].number_format = '0.00%'
-            ws[f'B{row}'] = letter
-            row += 1
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 18
-        ws.column_dimensions['B'].width = 15
+    # Save workbook
+    wb.save(filename)
 
-    def _get_category_weight(self, type_name: str) -> float:
-        """Get the weight for a category as a percentage (0-100)."""
-        # Try config first (both Canvas and manual config)
-        if hasattr(self, 'config') and self.config:
-            return self.config.weight_for_type(type_name) * 100
-        # Fallback to assignment groups if stored
-        elif hasattr(self, '_assignment_groups'):
-            for group in self._assignment_groups:
-                if getattr(group, 'name', None) == type_name:
-                    return getattr(group, 'group_weight', 0.0)
-        return 0.0
+
+# -------------------- Excel worker processes --------------------
+_worker_context: Optional[_ReportContext] = None
+
+
+def _init_excel_worker(context: _ReportContext) -> None:
+    """Receive the report context once per worker process."""
+    global _worker_context
+    _worker_context = context
+
+
+def _save_excel_in_worker(job: _ExcelJob) -> None:
+    """Write one student's Excel report in a worker process."""
+    _write_student_report(_worker_context, *job)
@@ -16,15 +16,41 @@ Offline usage supported via load_from_data().
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from typing import Any, Dict, List, Optional, Tuple
-from statistics import mean, median, pstdev
+from statistics import median
 from datetime import datetime
-import pickle
+import functools
+import gzip
+import heapq
+import json
+import math
+import os
 from pathlib import Path
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    _loads = json.loads
 
-@dataclass
+# Bumped whenever the layout written by Gradebook.save_to_cache() changes
+CACHE_FORMAT_VERSION = 1
+
+
+@functools.lru_cache(maxsize=4096)
+def display_name(name: str) -> str:
+    """Assignment name without any parenthesized suffix, as shown in reports.
+
+    Cached: the same few assignment names recur for every student.
+    """
+    return name.split('(', 1)[0].strip()
+
+
+@dataclass(slots=True)
 class Assignment:
     id: int
     name: str
@@ -32,8 +58,12 @@ class Assignment:
     due_at: Optional[str] = None  # ISO string
     assignment_group_id: Optional[int] = None  # Canvas assignment group
 
+    @property
+    def display_name(self) -> str:
+        return display_name(self.name)
 
-@dataclass
+
+@dataclass(slots=True)
 class StudentScore:
     assignment_id: int
     score: Optional[float] = None
@@ -45,7 +75,7 @@ class StudentScore:
     excused: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentSummary:
     id: Any
     name: Optional[str] = None
@@ -63,6 +93,12 @@ class StudentSummary:
         return None
 
 
+# Field order of the rows stored in gradebook cache files
+_ASSIGNMENT_FIELDS = tuple(f.name for f in fields(Assignment))
+_SCORE_FIELDS = tuple(f.name for f in fields(StudentScore))
+_STUDENT_FIELDS = ("id", "name", "login", "email", "sis_user_id", "total_score", "total_points")
+
+
 class Gradebook:
     """Gradebook model with data and analysis helpers."""
 
@@ -70,17 +106,25 @@ class Gradebook:
         self.course_id: Optional[int] = None
         self.assignments: Dict[int, Assignment] = {}
         self.students: Dict[Any, StudentSummary] = {}
+        self._columns: Optional[Dict[int, Tuple[List[float], int]]] = None
 
     # -------------------- Loaders --------------------
     def load_from_canvas(self, canvas_connection: Any, course_id: int, include_inactive: bool = False) -> None:
         """Load assignments, students (enrollments), and submissions from Canvas."""
+        from canvasapi.exceptions import ResourceDoesNotExist
+
+        from .course import Course
+
         self.course_id = course_id
-        canvas = canvas_connection.get_canvas()
-        course = canvas.get_course(course_id)
+        course_wrapper = Course(canvas_connection, course_id)
+        course = course_wrapper.canvas_course
 
-        # Fetch assignments
+        # Fetch assignments, keeping the canvasapi objects for the
+        # per-assignment submissions fallback below
+        canvas_assignments: List[Any] = []
         try:
             for a in course.get_assignments():
+                canvas_assignments.append(a)
                 pts = getattr(a, 'points_possible', None)
                 due = getattr(a, 'due_at', None)
                 group_id = getattr(a, 'assignment_group_id', None)
@@ -115,13 +159,19 @@ class Gradebook:
         except Exception as e:
             raise RuntimeError(f"Unable to retrieve student enrollments: {e}")
 
-        # Fetch submissions for each assignment
+        # Fetch submissions for all assignments in one paginated request
+        try:
+            submissions_by_assignment = course_wrapper.get_multiple_submissions(
+                list(self.assignments), include=["user"]
+            )
+        except ResourceDoesNotExist:
+            # Batch endpoint unavailable: one request per assignment, concurrently
+            submissions_by_assignment = course_wrapper.get_submissions_by_assignment(
+                canvas_assignments, include=["user"]
+            )
         for aid, assignment in list(self.assignments.items()):
             try:
-                submissions = assignment  # type: ignore[assignment]
-                # Using course.get_assignment(aid) first to ensure proper object
-                aobj = course.get_assignment(aid)
-                for sub in aobj.get_submissions(include=["user"]):
+                for sub in submissions_by_assignment.get(aid, []):
                     user = getattr(sub, 'user', None)
                     uid = getattr(sub, 'user_id', None) or (user.get('id') if isinstance(user, dict) else getattr(user, 'id', None))
                     if uid is None:
@@ -172,7 +222,7 @@ class Gradebook:
             )
         for u in students:
             uid = u['id']
-            self.students[uid] = StudentSummary(id=uid, name=u.get('name'), login=u.get('login'), email=u.get('email'))
+            self.students[uid] = StudentSummary(id=uid, name=u.get('name'), login=u.get('login'), email=u.get('email'), sis_user_id=u.get('sis_user_id'))
         for s in submissions:
             uid = s['user_id']
             aid = s['assignment_id']
@@ -198,25 +248,34 @@ class Gradebook:
         If a student lacks a submission for an assignment, its points are
         included in the denominator (total_points) with zero contribution to
         total_score. Excused submissions contribute neither points nor score.
+
+        Every student starts from the course-wide points total, so only the
+        student's own (sparse) submissions are walked: excused ones take
+        their points back out and scored ones add to the score.
         """
+        points = {
+            aid: assignment.points_possible if assignment.points_possible is not None else 0.0
+            for aid, assignment in self.assignments.items()
+        }
+        all_points = math.fsum(points.values())
         for stu in self.students.values():
-            total_score = 0.0
-            total_points = 0.0
-            for aid, assignment in self.assignments.items():
-                sc = stu.scores.get(aid)
-                pts = assignment.points_possible if assignment.points_possible is not None else 0.0
-                if sc is None:
-                    # Missing submission: count points, score = 0
-                    total_points += pts
+            excused_points = []
+            scores = []
+            for aid, sc in stu.scores.items():
+                pts = points.get(aid)
+                if pts is None:
+                    # Submission for an assignment not in the gradebook
                     continue
                 if sc.excused:
                     # Excused: skip both score and points
-                    continue
-                total_points += pts
-                if sc.score is not None:
-                    total_score += sc.score
-            stu.total_score = total_score
-            stu.total_points = total_points
+                    excused_points.append(pts)
+                elif sc.score is not None:
+                    scores.append(sc.score)
+            stu.total_score = math.fsum(scores)
+            stu.total_points = all_points - math.fsum(excused_points)
+        # Drop caches derived from the previous load
+        self._columns = None
+        self.__dict__.pop('assignments_by_name', None)
 
     # -------------------- Queries --------------------
     def get_assignments(self) -> List[Assignment]:
@@ -228,59 +287,80 @@ class Gradebook:
     def get_student(self, user_id: Any) -> Optional[StudentSummary]:
         return self.students.get(user_id)
 
+    @functools.cached_property
+    def assignments_by_name(self) -> Dict[str, Assignment]:
+        """Assignments keyed by name; the first one wins if names repeat.
+
+        Built on first access and dropped whenever a loader runs.
+        """
+        by_name: Dict[str, Assignment] = {}
+        for assignment in self.assignments.values():
+            by_name.setdefault(assignment.name, assignment)
+        return by_name
+
     # -------------------- Analytics --------------------
+    @staticmethod
+    def _describe(values: List[float]) -> Dict[str, Any]:
+        """Summary statistics for a non-empty list of floats."""
+        n = len(values)
+        avg = math.fsum(values) / n
+        return {
+            "count": n,
+            "mean": avg,
+            "median": median(values),
+            "std": math.sqrt(math.fsum((v - avg) ** 2 for v in values) / n) if n > 1 else 0.0,
+            "min": min(values),
+            "max": max(values),
+        }
+
+    def _score_columns(self) -> Dict[int, Tuple[List[float], int]]:
+        """Per-assignment graded scores and excused counts, built in one pass.
+
+        Cached until the totals are recomputed, so assignment_stats() over
+        every assignment costs one traversal of the gradebook rather than one
+        per assignment.
+        """
+        columns = getattr(self, '_columns', None)
+        if columns is None:
+            columns = {aid: ([], 0) for aid in self.assignments}
+            for stu in self.students.values():
+                for aid, sc in stu.scores.items():
+                    col = columns.get(aid)
+                    if col is None:
+                        col = columns[aid] = ([], 0)
+                    if sc.excused:
+                        columns[aid] = (col[0], col[1] + 1)
+                    elif sc.score is not None:
+                        col[0].append(sc.score)
+            self._columns = columns
+        return columns
+
     def overall_stats(self) -> Dict[str, Any]:
         """Compute stats across students with a percent value."""
-        percents = [s.percent for s in self.students.values() if s.percent is not None]
+        percents = [p for p in (s.percent for s in self.students.values()) if p is not None]
         if not percents:
             return {"count": 0, "mean": None, "median": None, "std": None}
-        return {
-            "count": len(percents),
-            "mean": mean(percents),
-            "median": median(percents),
-            "std": pstdev(percents) if len(percents) > 1 else 0.0,
-            "min": min(percents),
-            "max": max(percents),
-        }
+        return self._describe(percents)
 
     def assignment_stats(self, assignment_id: int) -> Dict[str, Any]:
-        scores: List[float] = []
-        missing = 0
-        excused = 0
-        for s in self.students.values():
-            sc = s.scores.get(assignment_id)
-            if sc is None:
-                missing += 1
-                continue
-            if sc.excused:
-                excused += 1
-                continue
-            if sc.score is not None:
-                scores.append(sc.score)
-            else:
-                missing += 1
+        scores, excused = self._score_columns().get(assignment_id, ([], 0))
+        # Students with no submission or an ungraded one count as missing
+        missing = len(self.students) - len(scores) - excused
         if not scores:
             return {"count": 0, "mean": None, "median": None, "std": None, "missing": missing, "excused": excused}
-        return {
-            "count": len(scores),
-            "mean": mean(scores),
-            "median": median(scores),
-            "std": pstdev(scores) if len(scores) > 1 else 0.0,
-            "min": min(scores),
-            "max": max(scores),
-            "missing": missing,
-            "excused": excused,
-        }
+        stats = self._describe(scores)
+        stats["missing"] = missing
+        stats["excused"] = excused
+        return stats
 
     def top_students(self, n: int = 10) -> List[Tuple[Any, float]]:
-        pairs = [(s.id, s.percent) for s in self.students.values() if s.percent is not None]
-        pairs.sort(key=lambda x: x[1], reverse=True)
-        return pairs[:n]
+        pairs = [(s.id, p) for s in self.students.values() if (p := s.percent) is not None]
+        return heapq.nlargest(n, pairs, key=lambda x: x[1])
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "course_id": self.course_id,
-            "assignments": [a.__dict__ for a in self.assignments.values()],
+            "assignments": [asdict(a) for a in self.assignments.values()],
             "students": [
                 {
                     "id": s.id,
@@ -295,19 +375,44 @@ class Gradebook:
             ],
         }
     
-    def save_to_cache(self, cache_file: str = "gradebook_cache.pkl") -> None:
+    def save_to_cache(self, cache_file: str = "gradebook_cache.json.gz") -> None:
         """Save gradebook to cache file for faster loading.
         
+        The cache is gzip-compressed JSON holding one row (list of field
+        values) per assignment, student and score rather than pickled objects.
+        
         Args:
-            cache_file: Path to cache file (default: gradebook_cache.pkl)
+            cache_file: Path to cache file (default: gradebook_cache.json.gz)
         """
+        data = {
+            "version": CACHE_FORMAT_VERSION,
+            "course_id": self.course_id,
+            "assignment_fields": _ASSIGNMENT_FIELDS,
+            "score_fields": _SCORE_FIELDS,
+            "student_fields": _STUDENT_FIELDS,
+            "assignments": [
+                [getattr(a, name) for name in _ASSIGNMENT_FIELDS]
+                for a in self.assignments.values()
+            ],
+            "students": [
+                [getattr(s, name) for name in _STUDENT_FIELDS]
+                + [[[getattr(sc, name) for name in _SCORE_FIELDS] for sc in s.scores.values()]]
+                for s in self.students.values()
+            ],
+        }
+        # Serialize and compress in memory, then write the file in one go
+        # through a temporary name so a partial cache is never left behind
         cache_path = Path(cache_file)
-        with open(cache_path, 'wb') as f:
-            pickle.dump(self, f)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(gzip.compress(_dumps(data), compresslevel=6))
+            os.replace(tmp_path, cache_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
         print(f"Gradebook cached to {cache_file}")
     
     @classmethod
-    def load_from_cache(cls, cache_file: str = "gradebook_cache.pkl") -> "Gradebook":
+    def load_from_cache(cls, cache_file: str = "gradebook_cache.json.gz") -> "Gradebook":
         """Load gradebook from cache file.
         
         Args:
@@ -318,13 +423,31 @@ class Gradebook:
             
         Raises:
             FileNotFoundError: If cache file doesn't exist
+            ValueError: If the cache was written in a different format
         """
         cache_path = Path(cache_file)
         if not cache_path.exists():
             raise FileNotFoundError(f"Cache file {cache_file} not found")
         
-        with open(cache_path, 'rb') as f:
-            gb = pickle.load(f)
+        data = _loads(gzip.decompress(cache_path.read_bytes()))
+        if (data.get("version") != CACHE_FORMAT_VERSION
+                or tuple(data.get("assignment_fields", ())) != _ASSIGNMENT_FIELDS
+                or tuple(data.get("score_fields", ())) != _SCORE_FIELDS
+                or tuple(data.get("student_fields", ())) != _STUDENT_FIELDS):
+            raise ValueError(f"Cache file {cache_file} has an unsupported format")
+        
+        gb = cls()
+        gb.course_id = data["course_id"]
+        for row in data["assignments"]:
+            assignment = Assignment(*row)
+            gb.assignments[assignment.id] = assignment
+        num_student_fields = len(_STUDENT_FIELDS)
+        for row in data["students"]:
+            student = StudentSummary(**dict(zip(_STUDENT_FIELDS, row)))
+            for score_row in row[num_student_fields]:
+                score = StudentScore(*score_row)
+                student.scores[score.assignment_id] = score
+            gb.students[student.id] = student
         
         print(f"Gradebook loaded from cache: {cache_file}")
         print(f"  Course ID: {gb.course_id}")
@@ -15,7 +15,7 @@ Usage example (without Canvas API):
         {"id": 2, "name": "Bob"},
     ])
     r.add_instructors({"id": 10, "name": "Prof. Smith"})
-    print(r.counts())           # {"students": 2, "instructors": 1, "tas": 0, "admins": 0, "observers": 0}
+    print(dict(r.counts()))     # {'students': 2, 'instructors': 1, 'tas': 0, 'admins': 0, 'observers': 0}
     print(r.find_user(1))       # ("students", {"id": 1, "name": "Alice"})
 
 Optional Canvas integration:
@@ -27,7 +27,10 @@ Optional Canvas integration:
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import itertools
+import operator
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, ValuesView
 
 try:
     # Optional runtime dependency
@@ -43,6 +46,34 @@ except Exception:  # pragma: no cover - keep optional
 RoleName = str
 UserDict = Dict[str, Any]
 
+# Keys kept in a normalized user dict, and the user-object attributes they come from
+_USER_KEYS: Tuple[str, ...] = ("id", "name", "login", "email", "sis_user_id")
+_USER_ATTRS: Tuple[str, ...] = ("id", "name", "login_id", "email", "sis_user_id")
+_USER_GETTER = operator.attrgetter(*_USER_ATTRS)
+
+# Distinguishes "absent" from a stored None in single-lookup dict reads
+_MISSING = object()
+
+# Map Canvas enrollment types to our roles. Some institutions use custom
+# role names containing 'Admin'; load_from_canvas handles admins separately.
+_ENROLL_TYPE_MAP: Mapping[str, RoleName] = MappingProxyType({
+    "StudentEnrollment": "students",
+    "TeacherEnrollment": "instructors",
+    "TaEnrollment": "tas",
+    "ObserverEnrollment": "observers",
+})
+
+
+# Exact container types passed through by _as_iter without further checks
+_BULK_TYPES = frozenset({list, tuple, set})
+
+
+def _as_iter(users: Any) -> Iterable[Any]:
+    """Wrap a single user (a dict or an object with an ``id``) in a list."""
+    if type(users) in _BULK_TYPES:
+        return users
+    return [users] if isinstance(users, dict) or hasattr(users, "id") else users
+
 
 class Roster:
     """In-memory roster of course participants organized by roles.
@@ -51,6 +82,8 @@ class Roster:
     Stores users as minimal serializable dictionaries.
     """
 
+    __slots__ = ("_roles", "_data", "_index", "_counts", "_views", "__weakref__")
+
     DEFAULT_ROLES: Tuple[RoleName, ...] = (
         "students",
         "instructors",
@@ -62,17 +95,35 @@ class Roster:
     def __init__(self, roles: Optional[Iterable[RoleName]] = None) -> None:
         self._roles: Tuple[RoleName, ...] = tuple(roles) if roles else self.DEFAULT_ROLES
         self._data: Dict[RoleName, Dict[Any, UserDict]] = {role: {} for role in self._roles}
+        # user id -> first role (in role order) holding that user, for find_user
+        self._index: Dict[Any, RoleName] = {}
+        # Read-only results of counts()/get_all(), dropped when they go stale
+        self._counts: Optional[Mapping[RoleName, int]] = None
+        self._views: Optional[Mapping[RoleName, ValuesView[UserDict]]] = None
 
     # -------------------- Introspection --------------------
     @property
     def roles(self) -> Tuple[RoleName, ...]:
         return self._roles
 
-    def counts(self) -> Dict[RoleName, int]:
-        return {role: len(self._data.get(role, {})) for role in self._roles}
+    def counts(self) -> Mapping[RoleName, int]:
+        """Return a read-only mapping (mappingproxy) of role -> number of users."""
+        if self._counts is None:
+            self._counts = MappingProxyType({role: len(self._data[role]) for role in self._roles})
+        return self._counts
 
-    def get_all(self) -> Dict[RoleName, List[UserDict]]:
-        return {role: list(self._data.get(role, {}).values()) for role in self._roles}
+    def get_all(self) -> Mapping[RoleName, ValuesView[UserDict]]:
+        """Return live, read-only views of each role's users.
+
+        The views reflect later changes to the roster, so do not hold one
+        across a mutation: iterating a view while add_user(), add_users() or
+        remove_user() changes the same role raises RuntimeError ("dictionary
+        changed size during iteration"). Use get_users() or list() on the
+        view for a stable copy.
+        """
+        if self._views is None:
+            self._views = MappingProxyType({role: self._data[role].values() for role in self._roles})
+        return self._views
 
     # -------------------- Normalization --------------------
     def _normalize_user(self, user: Any) -> UserDict:
@@ -88,45 +139,53 @@ class Roster:
                 raise ValueError("User dictionary must include an 'id' field")
             # Copy a minimal safe subset to avoid unexpected mutation
             return {
-                k: user.get(k)
-                for k in ("id", "name", "login", "email", "sis_user_id")
-                if k in user
+                k: v for k in _USER_KEYS if (v := user.get(k, _MISSING)) is not _MISSING
             }
 
         # Canvas User or any object with attributes
-        user_id = getattr(user, "id", None)
-        if user_id is None:
+        try:
+            values = _USER_GETTER(user)
+        except AttributeError:
+            # Canvas omits fields the token may not see (e.g. email)
+            values = tuple(getattr(user, attr, None) for attr in _USER_ATTRS)
+        if values[0] is None:
             raise ValueError("User object must have an 'id' attribute")
-
-        out: UserDict = {"id": user_id}
-        for attr, key in (
-            ("name", "name"),
-            ("login_id", "login"),
-            ("email", "email"),
-            ("sis_user_id", "sis_user_id"),
-        ):
-            val = getattr(user, attr, None)
-            if val is not None:
-                out[key] = val
-        return out
+        return {key: val for key, val in zip(_USER_KEYS, values) if val is not None}
 
     def _ensure_role(self, role: RoleName) -> None:
         if role not in self._roles:
             raise ValueError(f"Unknown role '{role}'. Valid roles: {', '.join(self._roles)}")
 
+    def _reindex(self, user_ids: Iterable[Any]) -> None:
+        """Point each user id in the index at the first role still holding it."""
+        for uid in user_ids:
+            for role in self._roles:
+                if uid in self._data[role]:
+                    self._index[uid] = role
+                    break
+            else:
+                self._index.pop(uid, None)
+
+    def _rebuild_index(self) -> None:
+        # Later assignments win, so walk roles backwards to keep the first role
+        self._index = {uid: role for role in reversed(self._roles) for uid in self._data[role]}
+
     # -------------------- Core operations --------------------
     def set_users(self, role: RoleName, users: Iterable[Any]) -> None:
         self._ensure_role(role)
-        bucket: Dict[Any, UserDict] = {}
-        for u in users:
-            nu = self._normalize_user(u)
-            bucket[nu["id"]] = nu
+        bucket: Dict[Any, UserDict] = {nu["id"]: nu for nu in map(self._normalize_user, users)}
+        previous = self._data[role]
         self._data[role] = bucket
+        self._reindex(previous.keys() | bucket.keys())
+        self._counts = self._views = None
 
     def add_user(self, role: RoleName, user: Any) -> None:
         self._ensure_role(role)
         nu = self._normalize_user(user)
         self._data[role][nu["id"]] = nu  # upsert
+        self._counts = None
+        if self._index.setdefault(nu["id"], role) != role:
+            self._reindex((nu["id"],))
 
     def add_users(self, role: RoleName, users: Iterable[Any]) -> None:
         for u in users:
@@ -138,52 +197,31 @@ class Roster:
 
     def remove_user(self, role: RoleName, user_id: Any) -> Optional[UserDict]:
         self._ensure_role(role)
-        return self._data[role].pop(user_id, None)
+        removed = self._data[role].pop(user_id, None)
+        if removed is not None:
+            self._counts = None
+            if self._index.get(user_id) == role:
+                self._reindex((user_id,))
+        return removed
 
     def clear_role(self, role: RoleName) -> None:
         self._ensure_role(role)
+        user_ids = list(self._data[role])
         self._data[role].clear()
+        self._reindex(user_ids)
+        self._counts = None
 
     def clear_all(self) -> None:
-        for role in self._roles:
-            self._data[role].clear()
+        # Rebinding releases the old hash tables in one step
+        self._data = {role: {} for role in self._roles}
+        self._index = {}
+        self._counts = self._views = None
 
     def find_user(self, user_id: Any) -> Optional[Tuple[RoleName, UserDict]]:
-        for role in self._roles:
-            if user_id in self._data[role]:
-                return role, self._data[role][user_id]
-        return None
-
-    # -------------------- Role-specific helpers --------------------
-    def add_students(self, users: Iterable[Any] | Any) -> None:
-        if isinstance(users, (list, tuple, set)):
-            self.add_users("students", users)
-        else:
-            self.add_user("students", users)
-
-    def add_instructors(self, users: Iterable[Any] | Any) -> None:
-        if isinstance(users, (list, tuple, set)):
-            self.add_users("instructors", users)
-        else:
-            self.add_user("instructors", users)
-
-    def add_tas(self, users: Iterable[Any] | Any) -> None:
-        if isinstance(users, (list, tuple, set)):
-            self.add_users("tas", users)
-        else:
-            self.add_user("tas", users)
-
-    def add_admins(self, users: Iterable[Any] | Any) -> None:
-        if isinstance(users, (list, tuple, set)):
-            self.add_users("admins", users)
-        else:
-            self.add_user("admins", users)
-
-    def add_observers(self, users: Iterable[Any] | Any) -> None:
-        if isinstance(users, (list, tuple, set)):
-            self.add_users("observers", users)
-        else:
-            self.add_user("observers", users)
+        role = self._index.get(user_id)
+        if role is None:
+            return None
+        return role, self._data[role][user_id]
 
     # -------------------- Serialization --------------------
     def to_dict(self) -> Dict[str, Any]:
@@ -203,57 +241,82 @@ class Roster:
         return r
 
     # -------------------- Canvas integration (optional) --------------------
-    def load_from_canvas(self, course: Any, include_inactive: bool = False) -> None:
+    def load_from_canvas(
+        self,
+        course: Any,
+        include_inactive: bool = False,
+        prefetched: Optional[Dict[str, List[Any]]] = None,
+    ) -> None:
         """Populate roster using a canvasapi Course.
 
         Attempts to derive users by enrollment type and role. This requires the
         canvasapi package and appropriate API permissions.
+
+        If ``prefetched`` is given (enrollments grouped by type, as returned by
+        ``Course.fetch_all_enrollments``), no Canvas request is made and
+        ``course`` may be None.
         """
-        if course is None:
+        if course is None and prefetched is None:
             raise ValueError("course is required")
 
-        # Map Canvas enrollment types/roles to our roles
-        type_map = {
-            "StudentEnrollment": "students",
-            "TeacherEnrollment": "instructors",
-            "TaEnrollment": "tas",
-            "ObserverEnrollment": "observers",
-            # Some institutions use custom role names containing 'Admin'
-            # We'll handle admins separately below.
-        }
-
-        # Fetch enrollments and bucket users
-        params = {"state": None} if include_inactive else {"state": ["active"]}
-        enrollments = list(course.get_enrollments(**params))  # type: ignore[attr-defined]
+        # Fetch enrollments and bucket users as the pages arrive
+        if prefetched is not None:
+            enrollments: Iterable[Any] = itertools.chain.from_iterable(prefetched.values())
+        else:
+            # Canvas's maximum page size; each enrollment already embeds its user
+            params = {"per_page": 100, "include": ["user"]}
+            params["state"] = None if include_inactive else ["active"]
+            enrollments = course.get_enrollments(**params)  # type: ignore[attr-defined]
 
         by_role: Dict[RoleName, Dict[Any, UserDict]] = {role: {} for role in self._roles}
 
+        skipped: List[Any] = []
         for enr in enrollments:
-            try:
-                # enrollment.type could be 'StudentEnrollment', etc.
-                etype = getattr(enr, "type", None)
-                role_name = None
-                if etype in type_map:
-                    role_name = type_map[etype]
-                else:
-                    # Fallback: check role string for 'Admin'
-                    role_str = getattr(enr, "role", "") or getattr(enr, "role_id", "")
-                    if isinstance(role_str, str) and "admin" in role_str.lower():
-                        role_name = "admins"
-
-                if role_name and role_name in by_role:
-                    # enrollment has user dict under 'user'
-                    u = getattr(enr, "user", None)
-                    if u is None and hasattr(enr, "user_id"):
-                        u = {"id": getattr(enr, "user_id")}
-                    if u is None:
-                        continue
-                    nu = self._normalize_user(u)
-                    by_role[role_name][nu["id"]] = nu
-            except Exception:
+            # enrollment.type could be 'StudentEnrollment', etc.
+            role_name = _ENROLL_TYPE_MAP.get(getattr(enr, "type", None))
+            if role_name is None:
+                # Fallback: check role string for 'Admin'
+                role_str = getattr(enr, "role", "") or getattr(enr, "role_id", "")
+                if isinstance(role_str, str) and "admin" in role_str.lower():
+                    role_name = "admins"
+            if role_name not in by_role:
+                continue
+
+            # enrollment has user dict under 'user'
+            u = getattr(enr, "user", None)
+            if u is None and hasattr(enr, "user_id"):
+                u = {"id": getattr(enr, "user_id")}
+            if u is None:
                 continue
+            try:
+                nu = self._normalize_user(u)
+                by_role[role_name][nu["id"]] = nu
+            except (ValueError, TypeError):
+                # Missing or unhashable user id
+                skipped.append(enr)
+
+        if skipped:
+            print(f"Warning: Skipped {len(skipped)} enrollment(s) without a usable user id")
 
         # Replace existing
         for role in self._roles:
             self._data[role] = by_role.get(role, {})
+        self._rebuild_index()
+        self._counts = self._views = None
+
+
+# -------------------- Role-specific helpers --------------------
+def _make_role_adder(role: RoleName):
+    def add(self: Roster, users: Iterable[Any] | Any) -> None:
+        self.add_users(role, _as_iter(users))
+
+    add.__name__ = f"add_{role}"
+    add.__qualname__ = f"Roster.add_{role}"
+    add.__doc__ = f"Add one user or an iterable of users as {role}."
+    return add
+
 
+# add_students, add_instructors, add_tas, add_admins, add_observers
+for _role in Roster.DEFAULT_ROLES:
+    setattr(Roster, f"add_{_role}", _make_role_adder(_role))
+del _role
@@ -27,9 +27,20 @@ WARNING: This script MODIFIES Canvas. Use with caution!
 from __future__ import annotations
 
 import argparse
-from typing import Dict, List, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from canvasapi.exceptions import RateLimitExceeded
 from canvas.connection import CanvasConnection
 
+# Concurrent create requests; kept low because Canvas throttles writes
+# much sooner than reads
+CREATE_WORKERS = 3
+# Attempts per create request still throttled after the HTTP-level
+# retries, waiting CREATE_BACKOFF seconds and doubling each time
+CREATE_RETRIES = 3
+CREATE_BACKOFF = 2.0
+
 
 class CourseBuilder:
     """Build and configure Canvas courses programmatically."""
@@ -38,6 +49,56 @@ class CourseBuilder:
         self.conn = canvas_connection
         self.canvas = canvas_connection.get_canvas()
         self.dry_run = dry_run
+        self._course_cache: Dict[int, Any] = {}
+        self.failed = 0  # create requests that failed for good
+    
+    def _get_course(self, course_id: int) -> Any:
+        """Fetch a course once and reuse it for every later step."""
+        course = self._course_cache.get(course_id)
+        if course is None:
+            course = self._course_cache[course_id] = self.canvas.get_course(course_id)
+        return course
+    
+    def _create_concurrently(
+        self,
+        create: Callable[[Dict[str, Any]], Any],
+        configs: List[Dict[str, Any]],
+        label: Callable[[Dict[str, Any]], Any],
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        """Issue one Canvas create request per config from a thread pool.
+        
+        Throttled requests are retried with backoff; a request that still
+        fails is reported, counted in self.failed and skipped without
+        affecting the others.
+        
+        Args:
+            create: Function sending the request for a single config
+            configs: Configurations to create
+            label: Function naming a config in error messages
+            
+        Returns:
+            List of (config, created object) pairs in the original config order
+        """
+        def create_with_retry(config: Dict[str, Any]) -> Any:
+            for attempt in range(CREATE_RETRIES):
+                try:
+                    return create(config)
+                except RateLimitExceeded:
+                    if attempt == CREATE_RETRIES - 1:
+                        raise
+                    time.sleep(CREATE_BACKOFF * 2 ** attempt)
+        
+        results: List[Optional[Tuple[Dict[str, Any], Any]]] = [None] * len(configs)
+        with ThreadPoolExecutor(max_workers=CREATE_WORKERS) as executor:
+            futures = {executor.submit(create_with_retry, config): i for i, config in enumerate(configs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = (configs[i], future.result())
+                except Exception as e:
+                    self.failed += 1
+                    print(f"  ✗ Error ({label(configs[i])}): {e}")
+        return [r for r in results if r is not None]
         
     def create_course(self, account_id: int, course_config: Dict[str, Any]) -> Optional[Any]:
         """Create a new course.
@@ -62,6 +123,7 @@ class CourseBuilder:
         try:
             account = self.canvas.get_account(account_id)
             course = account.create_course(course=course_config)
+            self._course_cache[course.id] = course
             print(f"  ✓ Created course ID: {course.id}")
             return course
         except Exception as e:
@@ -88,7 +150,7 @@ class CourseBuilder:
             return True
         
         try:
-            course = self.canvas.get_course(course_id)
+            course = self._get_course(course_id)
             
             # Update course settings
             if 'name' in settings or 'course_code' in settings:
@@ -142,16 +204,24 @@ class CourseBuilder:
             return []
         
         try:
-            course = self.canvas.get_course(course_id)
+            course = self._get_course(course_id)
             
             # Enable weighted assignment groups
             if use_weighted:
                 course.update(course={'apply_assignment_group_weights': True})
                 print("  ✓ Enabled weighted assignment groups")
             
-            # Create each assignment group
-            for group_config in groups:
-                ag = course.create_assignment_group(**group_config)
+            # Create the groups concurrently; explicit positions keep the
+            # configured order regardless of which request lands first
+            positioned = [
+                {"position": i, **group_config}
+                for i, group_config in enumerate(groups, start=1)
+            ]
+            for _, ag in self._create_concurrently(
+                lambda config: course.create_assignment_group(**config),
+                positioned,
+                lambda config: config['name'],
+            ):
                 created_groups.append(ag)
                 print(f"  ✓ Created: {ag.name} (ID: {ag.id})")
             
@@ -188,10 +258,13 @@ class CourseBuilder:
         created_assignments = []
         
         try:
-            course = self.canvas.get_course(course_id)
+            course = self._get_course(course_id)
             
-            for assignment_config in assignments:
-                assignment = course.create_assignment(assignment=assignment_config)
+            for _, assignment in self._create_concurrently(
+                lambda config: course.create_assignment(assignment=config),
+                assignments,
+                lambda config: config.get('name', 'Unnamed'),
+            ):
                 created_assignments.append(assignment)
                 print(f"  ✓ Created: {assignment.name} (ID: {assignment.id})")
             
@@ -228,7 +301,7 @@ class CourseBuilder:
             return None
         
         try:
-            course = self.canvas.get_course(course_id)
+            course = self._get_course(course_id)
             
             # Canvas API expects grading_scheme_entry format
             scheme_entries = [
@@ -277,13 +350,16 @@ class CourseBuilder:
         created_enrollments = []
         
         try:
-            course = self.canvas.get_course(course_id)
+            course = self._get_course(course_id)
             
-            for enrollment_config in enrollments:
-                enrollment = course.enroll_user(
-                    user=enrollment_config['user_id'],
-                    enrollment={"type": enrollment_config['type']}
-                )
+            for enrollment_config, enrollment in self._create_concurrently(
+                lambda config: course.enroll_user(
+                    user=config['user_id'],
+                    enrollment={"type": config['type']}
+                ),
+                enrollments,
+                lambda config: f"user {config['user_id']}",
+            ):
                 created_enrollments.append(enrollment)
                 print(f"  ✓ Enrolled user {enrollment_config['user_id']}")
             
@@ -366,6 +442,14 @@ def example_course_setup():
     }
 
 
+def _report_failures(builder: CourseBuilder) -> int:
+    """Warn if any create request failed; return the exit status."""
+    if builder.failed:
+        print(f"\n⚠  {builder.failed} create request(s) failed - the course template is incomplete")
+        return 1
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Create and configure Canvas course via API"
@@ -441,7 +525,7 @@ def main():
     if args.setup_groups_only:
         print("\n" + "=" * 70)
         print("Done! (groups only)")
-        return 0
+        return _report_failures(builder)
     
     # Create sample assignments
     if groups and not args.dry_run:
@@ -487,7 +571,9 @@ def main():
         print("  python3 create_course_template.py --course-id YOUR_COURSE_ID")
         print("\nOr to create a new course (requires admin):")
         print("  python3 create_course_template.py --create-new --account-id 1")
+    
+    return _report_failures(builder)
 
 
 if __name__ == "__main__":
-    main()
+    exit(main())
@@ -3,27 +3,33 @@
 import csv
 import yaml
 
+# libyaml's C emitter when available
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 def csv_to_yaml(csv_file, yaml_file):
   """Converts a CSV file to a YAML file.
 
+  Rows are written one at a time, so memory use does not grow with the
+  size of the CSV file.
+
   Args:
     csv_file: The path to the CSV file.
     yaml_file: The path to the YAML file.
   """
 
-  with open(csv_file, "r") as f_csv, open(yaml_file, "w") as f_yaml:
-    reader = csv.reader(f_csv)
-    header = next(reader)
+  with open(csv_file, "r", newline="") as f_csv, open(yaml_file, "w") as f_yaml:
+    reader = csv.DictReader(f_csv)
 
-    data = []
+    empty = True
     for row in reader:
-      row_data = {}
-      for i, column in enumerate(header):
-        row_data[column] = row[i]
-
-      data.append(row_data)
-
-    yaml.dump(data, f_yaml, default_flow_style=False)
+      # Cells beyond the header are dropped, as before
+      row.pop(None, None)
+      # Each single-item list emits one "- key: value" block of the sequence
+      yaml.dump([row], f_yaml, Dumper=_YAML_DUMPER, default_flow_style=False)
+      empty = False
+
+    if empty:
+      yaml.dump([], f_yaml, Dumper=_YAML_DUMPER, default_flow_style=False)
 
 if __name__ == "__main__":
     import argparse
@@ -2,7 +2,13 @@
 """
 Diagnostic script to check which assignments have non-zero scores
 """
+import re
 import sys
+from pathlib import Path
+
+# Whole lines (token order does not matter) that are worth reporting
+ZERO_SCORE_LINE = re.compile(r"^(?=.*0\.00%)(?=.*pts\)).*$", re.MULTILINE)
+LAB_REPORT_LINE = re.compile(r"^(?=.*Lab Report)(?=.*(?:0\.00%|pts\))).*$", re.MULTILINE)
 
 # Read from the individual grade file to see what's there
 filename = "individual-grades/Student Example.txt"
@@ -11,10 +17,8 @@ print("Reading from:", filename)
 print("\nAssignments with 0.00%:")
 print("-" * 70)
 
-with open(filename, 'r') as f:
-    for line in f:
-        if "0.00%" in line and "pts)" in line:
-            print(line.strip())
+for match in ZERO_SCORE_LINE.finditer(Path(filename).read_text()):
+    print(match.group().strip())
 
 print("\n" + "=" * 70)
 print("\nTo check if lab reports are truly ungraded, we need to look at")
@@ -22,14 +26,14 @@ print("multiple students. Let's check a few more files...")
 print("=" * 70)
 
 import os
-grade_files = sorted([f for f in os.listdir("individual-grades") if f.endswith(".txt")])[:5]
+with os.scandir("individual-grades") as entries:
+    grade_files = sorted(e.name for e in entries if e.name.endswith(".txt") and e.is_file())[:5]
 
 for gf in grade_files:
     print(f"\n{gf}:")
-    with open(f"individual-grades/{gf}", 'r') as f:
-        lines = f.readlines()
-        for line in lines:
-            if "Lab Report" in line and "0.00%" in line:
-                print("  ", line.strip())
-            elif "Lab Report" in line and "0.00%" not in line and "pts)" in line:
-                print("  ", line.strip(), "<-- NON-ZERO")
+    for match in LAB_REPORT_LINE.finditer(Path(f"individual-grades/{gf}").read_text()):
+        line = match.group().strip()
+        if "0.00%" in line:
+            print("  ", line)
+        else:
+            print("  ", line, "<-- NON-ZERO")
@@ -18,22 +18,34 @@ Requirements:
 from __future__ import annotations
 
 import argparse
+import functools
+import json
+import mimetypes
 import os
+import queue
 import smtplib
-import pickle
 import getpass
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from email import policy
+from email.message import EmailMessage, MIMEPart
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 from datetime import datetime
 
 from canvas.connection import CanvasConnection
 from canvas.course import Course
 from canvas.gradebook import get_course_gradebook
 
+try:
+    # Optional: keep cached SMTP passwords in the OS keychain instead of a file
+    import keyring
+    HAS_KEYRING = True
+except ImportError:
+    HAS_KEYRING = False
+
+KEYRING_SERVICE = 'canvas_email'
+
 
 # ============================================================================
 # EMAIL CONFIGURATION - Edit these values for your setup
@@ -91,6 +103,204 @@ CONFIG = {
 # }
 # ============================================================================
 
+# Concurrent SMTP connections used once no per-student confirmation is needed.
+# Keep this small: mail servers limit connections per client address.
+SMTP_CONNECTIONS = 4
+
+# Encoded attachments kept for reuse (e.g. the same file sent to several
+# recipients); bounded so a full class does not pin every report in memory
+ATTACHMENT_CACHE_SIZE = 16
+
+
+# Fixed parts of the email body. Only the greeting and the report differ
+# between students; the intro is filled in with the course name once per run.
+BODY_SEPARATOR = '=' * 70
+
+BODY_INTRO_FINAL = """Here is your final grade report for {course_name}.
+
+This report shows your final course grade based on all graded assignments completed this semester.
+
+"""
+
+BODY_EXCEL_BLURB_FINAL = """I've attached an Excel spreadsheet with your grades. The spreadsheet includes:
+- All your assignment scores organized by category
+- Formulas showing exactly how your grade is calculated
+- A "Grades" sheet with the letter grade conversion scale
+- Complete breakdown of all work completed during the semester
+
+"""
+
+BODY_FOOTER_FINAL = """These are your official final grades for the course. If you have any questions about your final grade calculation, please don't hesitate to reach out.
+
+Thank you for your hard work this semester!
+
+Best regards
+
+""" + BODY_SEPARATOR + "\n\n"
+
+BODY_INTRO_MID = """Here is your individual grade report for {course_name}.
+
+This report shows your current standing based on graded assignments completed so far this semester.
+
+"""
+
+BODY_EXCEL_BLURB_MID = """I've attached an Excel spreadsheet with your grades. The spreadsheet includes:
+- All your assignment scores organized by category
+- Formulas showing exactly how your grade is calculated
+- A "Grades" sheet with the letter grade conversion scale
+- You can modify scores to see how hypothetical changes would affect your grade
+
+"""
+
+BODY_FOOTER_MID = """If you have any questions about your grades, please don't hesitate to reach out.
+
+Best regards
+
+────────────────────────
+IMPORTANT DISCLAIMER:
+
+I want to clarify once again that this is just for the purpose of giving you an idea of how to compute your grade based on the work done so far. The percentage and the letter grade is not a predictor of your final course grade, as it's missing a large part of the grade (final %35%, and several ungraded or unassigned psets, labs and quizlets). The computation of your current grade is done by normalizing the scores you have obtained with the maximum score possible in all the work graded so far.
+────────────────────────
+
+""" + BODY_SEPARATOR + "\n\n"
+
+
+def connect_smtp(
+    smtp_server: str,
+    smtp_port: int,
+    smtp_user: Optional[str] = None,
+    smtp_password: Optional[str] = None,
+    use_tls: bool = True,
+) -> smtplib.SMTP:
+    """Open an SMTP connection, logging in if credentials are given.
+
+    Args:
+        smtp_server: SMTP server hostname
+        smtp_port: SMTP server port
+        smtp_user: SMTP username (if authentication required)
+        smtp_password: SMTP password (if authentication required)
+        use_tls: Use TLS encryption
+
+    Returns:
+        Connected (and authenticated) SMTP object
+    """
+    # Port 465 uses implicit SSL (SMTP_SSL), others use STARTTLS
+    if smtp_port == 465:
+        server = smtplib.SMTP_SSL(smtp_server, smtp_port)
+    else:
+        server = smtplib.SMTP(smtp_server, smtp_port)
+    try:
+        if smtp_port != 465 and use_tls:
+            server.starttls()
+        if smtp_user and smtp_password:
+            server.login(smtp_user, smtp_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def send_message_on(server: smtplib.SMTP, msg: EmailMessage) -> None:
+    """Send a message over an already connected SMTP server.
+
+    Args:
+        server: Connected (and authenticated) SMTP object
+        msg: Message to send
+    """
+    server.send_message(msg)
+
+
+class SMTPSession:
+    """SMTP connection opened on first use and reused for later messages.
+
+    Sending many emails through one session pays the TCP, TLS and AUTH
+    handshakes once instead of once per message. If the server drops an
+    idle connection, the session reconnects and retries the message once.
+    """
+
+    def __init__(
+        self,
+        smtp_server: str,
+        smtp_port: int,
+        smtp_user: Optional[str] = None,
+        smtp_password: Optional[str] = None,
+        use_tls: bool = True,
+    ):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.smtp_user = smtp_user
+        self.smtp_password = smtp_password
+        self.use_tls = use_tls
+        self._server: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        self._server = connect_smtp(
+            self.smtp_server, self.smtp_port, self.smtp_user, self.smtp_password, self.use_tls
+        )
+        return self._server
+
+    def send(self, msg: EmailMessage) -> None:
+        """Send a message, connecting first if needed."""
+        if self._server is None:
+            send_message_on(self._connect(), msg)
+            return
+        try:
+            send_message_on(self._server, msg)
+        except smtplib.SMTPServerDisconnected:
+            # Servers close idle connections (e.g. while a prompt waits for
+            # input); a fresh connection gets one more attempt
+            self._server = None
+            send_message_on(self._connect(), msg)
+
+    def close(self) -> None:
+        """Close the connection, if open."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except smtplib.SMTPException:
+                self._server.close()
+            self._server = None
+
+    def __enter__(self) -> "SMTPSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def build_attachment(path: Path) -> MIMEPart:
+    """Read a file into a base64-encoded MIME attachment part.
+
+    The raw file contents are released as soon as they are encoded; only the
+    encoded part is kept with the message. Parts are cached by path,
+    modification time and size, so a file attached to several messages is
+    read and encoded once.
+
+    Args:
+        path: File to attach
+
+    Returns:
+        Attachment part, typed from the file extension (e.g. .xlsx)
+    """
+    stat = path.stat()
+    return _encoded_attachment(path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=ATTACHMENT_CACHE_SIZE)
+def _encoded_attachment(path: Path, mtime_ns: int, size: int) -> MIMEPart:
+    # mtime_ns and size only key the cache, so an edited file is re-encoded
+    content_type, _ = mimetypes.guess_type(path.name)
+    maintype, subtype = (content_type or 'application/octet-stream').split('/', 1)
+    part = MIMEPart(policy=policy.SMTP)
+    part.set_content(
+        path.read_bytes(),
+        maintype=maintype,
+        subtype=subtype,
+        disposition='attachment',
+        filename=path.name,
+    )
+    return part
+
 
 def send_email_with_attachment(
     to_email: str,
@@ -105,6 +315,7 @@ def send_email_with_attachment(
     smtp_password: Optional[str] = None,
     use_tls: bool = True,
     retry_on_auth_fail: bool = False,
+    session: Optional[SMTPSession] = None,
 ) -> tuple:
     """Send an email with optional attachment(s).
 
@@ -121,56 +332,44 @@ def send_email_with_attachment(
         smtp_password: SMTP password (if authentication required)
         use_tls: Use TLS encryption
         retry_on_auth_fail: If True, returns special status on auth failure
+        session: Optional open SMTPSession to send through; when None, a
+            connection is opened for this message only (the smtp_* and
+            use_tls arguments are then used)
 
     Returns:
         Tuple of (success: bool, error_type: Optional[str])
         error_type is 'auth_failed' if authentication failed, None otherwise
     """
     try:
-        # Create message
-        msg = MIMEMultipart()
+        # Create message; the SMTP policy serializes with CRLF line endings
+        # directly, so smtplib has no line endings left to rewrite
+        msg = EmailMessage(policy=policy.SMTP)
         msg['From'] = from_email
         msg['To'] = to_email
         msg['Subject'] = subject
 
         # Add body
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
 
-        # Collect all attachments
+        # Collect all attachments (callers pass existing files)
         attachments = []
-        if attachment_path and attachment_path.exists():
+        if attachment_path:
             attachments.append(attachment_path)
         if attachment_paths:
-            attachments.extend([p for p in attachment_paths if p.exists()])
+            attachments.extend(attachment_paths)
 
         # Add all attachments
-        for attach_path in attachments:
-            with open(attach_path, 'rb') as f:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(f.read())
-
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename={attach_path.name}'
-            )
-            msg.attach(part)
-
-        # Connect to SMTP server and send
-        # Port 465 uses implicit SSL (SMTP_SSL), others use STARTTLS
-        if smtp_port == 465:
-            server = smtplib.SMTP_SSL(smtp_server, smtp_port)
-        elif use_tls:
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
+        if attachments:
+            msg.make_mixed()
+            for attach_path in attachments:
+                msg.attach(build_attachment(attach_path))
+
+        # Send through the caller's session, or a one-off connection
+        if session is not None:
+            session.send(msg)
         else:
-            server = smtplib.SMTP(smtp_server, smtp_port)
-
-        if smtp_user and smtp_password:
-            server.login(smtp_user, smtp_password)
-
-        server.send_message(msg)
-        server.quit()
+            with SMTPSession(smtp_server, smtp_port, smtp_user, smtp_password, use_tls) as one_off:
+                one_off.send(msg)
 
         return (True, None)
 
@@ -224,19 +423,102 @@ def get_email_config(prompt_password: bool = False) -> dict:
     return config
 
 
+def find_latest_cache(course_id: int) -> Optional[Tuple[str, float]]:
+    """Find the newest gradebook cache file for a course in the current directory.
+
+    Cache files are named gradebook_{course_id}_{YYYYMMDD}.json.gz, so the
+    greatest name is the latest download. The directory is read once and
+    only the chosen file is stat'ed.
+
+    Args:
+        course_id: Canvas course ID
+
+    Returns:
+        Tuple of (file name, modification time) or None if there is no cache
+    """
+    prefix, suffix = f"gradebook_{course_id}_", ".json.gz"
+    latest = None
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffix) and (latest is None or name > latest.name):
+                latest = entry
+    if latest is None:
+        return None
+    return latest.name, latest.stat().st_mtime
+
+
+def read_report(path: Path) -> str:
+    """Read a grade report in one call and decode it in one pass."""
+    # set_content() normalizes line endings when the body is encoded
+    return path.read_bytes().decode('utf-8')
+
+
+def iter_reports(paths: Iterable[Path], lookahead: int = 1) -> Iterator[str]:
+    """Yield report contents in order, reading ahead on a background thread.
+
+    While one report is being emailed, the next is already loading, so disk
+    reads overlap with SMTP sends. At most ``lookahead`` extra reports are
+    held in memory.
+
+    Args:
+        paths: Report files, in the order they will be consumed
+        lookahead: Number of reports to read ahead of the consumer
+
+    Yields:
+        Decoded report text for each path
+    """
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending = deque()
+        for path in paths:
+            pending.append(reader.submit(read_report, path))
+            if len(pending) > lookahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def sanitize_filename(name: str) -> str:
     """Convert student name to filename (matching process_grades.py convention)."""
     return name
 
 
 def get_password_cache_file() -> Path:
-    """Get the path to the password cache file."""
-    return Path.home() / '.canvas_email_password.pkl'
+    """Get the path to the password cache file (used when keyring is unavailable)."""
+    return Path.home() / '.canvas_email_password.json'
+
+
+def _password_key(smtp_user: str, smtp_server: str) -> str:
+    return f"{smtp_user}@{smtp_server}"
+
+
+def _read_password_file() -> dict:
+    try:
+        with open(get_password_cache_file(), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_password_file(cache: dict) -> None:
+    # Written to a user-only (0600) temp file and renamed into place, so the
+    # cache is never readable by others nor left half-written
+    cache_file = get_password_cache_file()
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    tmp_file.unlink(missing_ok=True)
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(tmp_file, cache_file)
 
 
 def load_cached_password(smtp_user: str, smtp_server: str) -> Optional[str]:
     """Load cached password for given user/server if available.
     
+    Looks in the OS keychain first (if keyring is installed), then in the
+    password cache file.
+    
     Args:
         smtp_user: SMTP username
         smtp_server: SMTP server
@@ -244,57 +526,67 @@ def load_cached_password(smtp_user: str, smtp_server: str) -> Optional[str]:
     Returns:
         Cached password or None if not found
     """
-    cache_file = get_password_cache_file()
-    if not cache_file.exists():
-        return None
+    key = _password_key(smtp_user, smtp_server)
+    if HAS_KEYRING:
+        try:
+            password = keyring.get_password(KEYRING_SERVICE, key)
+            if password:
+                return password
+        except Exception:
+            pass  # No usable keychain backend; try the file
     
-    try:
-        with open(cache_file, 'rb') as f:
-            cache = pickle.load(f)
-        key = f"{smtp_user}@{smtp_server}"
-        return cache.get(key)
-    except Exception:
-        return None
+    return _read_password_file().get(key)
 
 
 def save_password_to_cache(smtp_user: str, smtp_server: str, password: str) -> None:
-    """Save password to cache file.
+    """Save password to the OS keychain, or to the cache file without keyring.
     
     Args:
         smtp_user: SMTP username
         smtp_server: SMTP server
         password: Password to cache
     """
-    cache_file = get_password_cache_file()
-    
-    # Load existing cache
-    cache = {}
-    if cache_file.exists():
+    key = _password_key(smtp_user, smtp_server)
+    if HAS_KEYRING:
         try:
-            with open(cache_file, 'rb') as f:
-                cache = pickle.load(f)
+            keyring.set_password(KEYRING_SERVICE, key, password)
+            return
         except Exception:
-            cache = {}
+            pass  # No usable keychain backend; fall back to the file
     
-    # Update cache
-    key = f"{smtp_user}@{smtp_server}"
+    cache = _read_password_file()
     cache[key] = password
-    
-    # Save cache with restricted permissions
     try:
-        with open(cache_file, 'wb') as f:
-            pickle.dump(cache, f)
-        # Set file permissions to user-only read/write (0600)
-        cache_file.chmod(0o600)
+        _write_password_file(cache)
     except Exception as e:
         print(f"Warning: Could not save password cache: {e}")
 
 
+def invalidate_cached_password(smtp_user: str, smtp_server: str) -> None:
+    """Forget the cached password for given user/server (e.g. after auth failure).
+    
+    Args:
+        smtp_user: SMTP username
+        smtp_server: SMTP server
+    """
+    key = _password_key(smtp_user, smtp_server)
+    if HAS_KEYRING:
+        try:
+            keyring.delete_password(KEYRING_SERVICE, key)
+        except Exception:
+            pass  # Not stored there (or no backend)
+    
+    cache = _read_password_file()
+    if cache.pop(key, None) is not None:
+        try:
+            _write_password_file(cache)
+        except Exception:
+            pass
+
+
 def clear_password_cache() -> None:
     """Clear the password cache file."""
-    cache_file = get_password_cache_file()
-    if cache_file.exists():
-        cache_file.unlink()
+    get_password_cache_file().unlink(missing_ok=True)
 
 
 def test_email_configuration(email_config: dict, retry_password: bool = True) -> bool:
@@ -378,19 +670,7 @@ This was sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             print("  Password may be incorrect or cached password expired.")
             # Clear the bad password from cache
             if email_config['smtp_user']:
-                cache_file = get_password_cache_file()
-                if cache_file.exists():
-                    try:
-                        with open(cache_file, 'rb') as f:
-                            cache = pickle.load(f)
-                        key = f"{email_config['smtp_user']}@{email_config['smtp_server']}"
-                        if key in cache:
-                            del cache[key]
-                            with open(cache_file, 'wb') as f:
-                                pickle.dump(cache, f)
-                            cache_file.chmod(0o600)
-                    except Exception:
-                        pass
+                invalidate_cached_password(email_config['smtp_user'], email_config['smtp_server'])
             
             # Ask for password again
             print("\nPlease enter your password again:")
@@ -410,6 +690,8 @@ This was sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 def main():
     parser = argparse.ArgumentParser(description="Email individual grade reports to students")
     parser.add_argument("--course-id", type=int, help="Canvas course ID (optional)")
+    parser.add_argument("--refresh-courses", action="store_true",
+                       help="Ignore the cached course list when prompting for a course")
     parser.add_argument("--reports-dir", type=str,
                        help="Directory containing individual grade report files (default: {course}-{date}/individual-grades)")
     parser.add_argument("--subject", type=str,
@@ -433,6 +715,8 @@ def main():
                        help="Don't ask for confirmation before each email")
     parser.add_argument("--final-grades", action="store_true",
                        help="Use final grades message (instead of mid-semester message)")
+    parser.add_argument("--smtp-connections", type=int, default=SMTP_CONNECTIONS,
+                       help=f"Parallel SMTP connections when not confirming each email (default: {SMTP_CONNECTIONS})")
     args = parser.parse_args()
 
     # Load email configuration (CONFIG constant + env vars + command line overrides)
@@ -475,19 +759,16 @@ def main():
     # Connect to Canvas
     print("Connecting to Canvas...")
     conn = CanvasConnection()
-    course = Course.from_args(conn, args.course_id)
+    course = Course.from_args(conn, args.course_id, refresh_courses=args.refresh_courses)
     course_id = course.course_id
     course_code = course.course_code
 
     # Find latest cache file for this course
-    import glob
-    cache_pattern = f"gradebook_{course_id}_*.pkl"
-    cache_files = sorted(glob.glob(cache_pattern), reverse=True)
+    latest = find_latest_cache(course_id)
 
     use_cache = False
-    if cache_files and not args.no_cache:
-        latest_cache = cache_files[0]
-        cache_time = os.path.getmtime(latest_cache)
+    if latest and not args.no_cache:
+        latest_cache, cache_time = latest
         cache_date = datetime.fromtimestamp(cache_time).strftime("%Y-%m-%d %H:%M:%S")
 
         print(f"\nFound cached gradebook: {latest_cache}")
@@ -506,7 +787,7 @@ def main():
 
         # Save to cache
         today = datetime.now().strftime("%Y%m%d")
-        cache_file = f"gradebook_{course_id}_{today}.pkl"
+        cache_file = f"gradebook_{course_id}_{today}.json.gz"
         gb.save_to_cache(cache_file)
 
     students = gb.get_students()
@@ -524,6 +805,23 @@ def main():
         print("Please run process_grades.py first to generate individual reports.")
         return 1
 
+    # List the directory once instead of checking each student's files
+    with os.scandir(reports_dir) as entries:
+        report_names = {entry.name for entry in entries if entry.is_file()}
+
+    # Decide who gets an email before any prompting or sending
+    to_send = []
+    skipped = []
+    for student in students:
+        report_file = reports_dir / f"{sanitize_filename(student.name)}.txt"
+        excel_file = reports_dir / f"{sanitize_filename(student.name)}.xlsx"
+        if not student.email:
+            skipped.append((student, "no email address"))
+        elif report_file.name not in report_names:
+            skipped.append((student, f"no report file found ({report_file.name})"))
+        else:
+            to_send.append((student, report_file, excel_file if excel_file.name in report_names else None))
+
     print(f"\nFound {len(students)} students")
     print(f"Reports directory: {reports_dir}")
     print(f"Email configuration:")
@@ -532,6 +830,12 @@ def main():
     print(f"  TLS: {email_config['use_tls']}")
     print(f"  Auth: {'Yes' if email_config['smtp_user'] else 'No'}")
 
+    if skipped:
+        print(f"\nSkipping {len(skipped)} student(s):")
+        for student, reason in skipped:
+            print(f"  SKIP: {student.name} - {reason}")
+    print(f"\nEmails to send: {len(to_send)}")
+
     if args.dry_run:
         print("\n*** DRY RUN MODE - No emails will be sent ***\n")
 
@@ -569,186 +873,185 @@ def main():
             print("Cancelled.")
             return 0
 
-    # Email each student
-    sent_count = 0
-    failed_count = 0
-    skipped_count = 0
-    user_quit = False
-
-    for idx, student in enumerate(students, 1):
-        if user_quit:
-            print(f"SKIP: {student.name} - user cancelled")
-            skipped_count += 1
-            continue
-            
-        if not student.email:
-            print(f"SKIP: {student.name} - no email address")
-            skipped_count += 1
-            continue
-
-        # Find grade report files (text and Excel)
-        report_file = reports_dir / f"{sanitize_filename(student.name)}.txt"
-        excel_file = reports_dir / f"{sanitize_filename(student.name)}.xlsx"
-
-        if not report_file.exists():
-            print(f"SKIP: {student.name} - no report file found ({report_file.name})")
-            skipped_count += 1
-            continue
-
-        # Prepare email
-        to_email = args.test_email if args.test_email else student.email
-
-        # Read the grade report file content
-        with open(report_file, 'r', encoding='utf-8') as f:
-            report_content = f.read()
-
-        # Check if Excel file exists
-        has_excel = excel_file.exists()
-
-        # Build email body based on whether these are final grades or mid-semester
-        if args.final_grades:
-            # Final grades message
-            body = f"""Dear {student.name},
-
-Here is your final grade report for {course.name}.
-
-This report shows your final course grade based on all graded assignments completed this semester.
-
-"""
-            if has_excel:
-                body += f"""I've attached an Excel spreadsheet with your grades. The spreadsheet includes:
-- All your assignment scores organized by category
-- Formulas showing exactly how your grade is calculated
-- A "Grades" sheet with the letter grade conversion scale
-- Complete breakdown of all work completed during the semester
-
-"""
-
-            body += f"""These are your official final grades for the course. If you have any questions about your final grade calculation, please don't hesitate to reach out.
-
-Thank you for your hard work this semester!
-
-Best regards
-
-{'='*70}
-
-{report_content}
-"""
-        else:
-            # Mid-semester / progress report message
-            body = f"""Dear {student.name},
-
-Here is your individual grade report for {course.name}.
-
-This report shows your current standing based on graded assignments completed so far this semester.
-
-"""
-
-            if has_excel:
-                body += f"""I've attached an Excel spreadsheet with your grades. The spreadsheet includes:
-- All your assignment scores organized by category
-- Formulas showing exactly how your grade is calculated
-- A "Grades" sheet with the letter grade conversion scale
-- You can modify scores to see how hypothetical changes would affect your grade
-
-"""
+    # SMTP connections, each opened on its first send and then reused. The
+    # first serves the confirm-each-email path; once no prompts remain, sends
+    # are spread over all of them from a thread pool.
+    sessions = [
+        SMTPSession(
+            email_config['smtp_server'],
+            email_config['smtp_port'],
+            email_config['smtp_user'],
+            email_config['smtp_password'],
+            email_config['use_tls'],
+        )
+        for _ in range(max(1, args.smtp_connections))
+    ]
+    session = sessions[0]
+    idle_sessions: "queue.Queue[SMTPSession]" = queue.Queue()
+    for pooled in sessions:
+        idle_sessions.put(pooled)
+
+    def send_pooled(**kwargs) -> tuple:
+        # Each worker borrows a connection for the duration of one send
+        pooled = idle_sessions.get()
+        try:
+            return send_email_with_attachment(session=pooled, **kwargs)
+        finally:
+            idle_sessions.put(pooled)
 
-            body += f"""If you have any questions about your grades, please don't hesitate to reach out.
+    executor: Optional[ThreadPoolExecutor] = None
+    pending = {}
 
-Best regards
+    # Message fragments shared by every student
+    if args.final_grades:
+        body_intro = BODY_INTRO_FINAL.format(course_name=course.name)
+        body_excel_blurb, body_footer = BODY_EXCEL_BLURB_FINAL, BODY_FOOTER_FINAL
+    else:
+        body_intro = BODY_INTRO_MID.format(course_name=course.name)
+        body_excel_blurb, body_footer = BODY_EXCEL_BLURB_MID, BODY_FOOTER_MID
 
-────────────────────────
-IMPORTANT DISCLAIMER:
+    # Reports in the order the loop below reads them
+    reports = iter_reports(report_file for _, report_file, _ in to_send)
 
-I want to clarify once again that this is just for the purpose of giving you an idea of how to compute your grade based on the work done so far. The percentage and the letter grade is not a predictor of your final course grade, as it's missing a large part of the grade (final %35%, and several ungraded or unassigned psets, labs and quizlets). The computation of your current grade is done by normalizing the scores you have obtained with the maximum score possible in all the work graded so far.
-────────────────────────
-
-{'='*70}
+    # Email each student
+    sent_count = 0
+    failed_count = 0
+    skipped_count = len(skipped)
+    user_quit = False
 
-{report_content}
-"""
+    try:
+        for idx, (student, report_file, excel_file) in enumerate(to_send, 1):
+            if user_quit:
+                print(f"SKIP: {student.name} - user cancelled")
+                skipped_count += 1
+                continue
 
-        # Ask for confirmation before sending (unless --no-confirm flag is set)
-        if not args.dry_run and not args.no_confirm:
-            print(f"\n{'='*70}")
-            print(f"Student {idx}/{len(students)}: {student.name}")
-            print(f"{'='*70}")
-            print(f"Email: {to_email}")
-            print(f"Report file: {report_file.name}")
-            if has_excel:
-                print(f"Excel file: {excel_file.name}")
-            else:
-                print(f"Excel file: (not found)")
-            print()
+            # Prepare email
+            to_email = args.test_email if args.test_email else student.email
+
+            # Already read (or being read) in the background
+            report_content = next(reports)
+
+            # Check if Excel file exists
+            has_excel = excel_file is not None
+
+            # Build email body based on whether these are final grades or mid-semester
+            body = "".join((
+                f"Dear {student.name},\n\n",
+                body_intro,
+                body_excel_blurb if has_excel else "",
+                body_footer,
+                report_content,
+                "\n",
+            ))
+
+            # Ask for confirmation before sending (unless --no-confirm flag is set)
+            if not args.dry_run and not args.no_confirm:
+                print(f"\n{'='*70}")
+                print(f"Student {idx}/{len(to_send)}: {student.name}")
+                print(f"{'='*70}")
+                print(f"Email: {to_email}")
+                print(f"Report file: {report_file.name}")
+                if has_excel:
+                    print(f"Excel file: {excel_file.name}")
+                else:
+                    print(f"Excel file: (not found)")
+                print()
             
-            while True:
-                response = input("Send email? ([y]es/[n]o/[q]uit/[p]review/[a]ll): ").strip().lower()
+                while True:
+                    response = input("Send email? ([y]es/[n]o/[q]uit/[p]review/[a]ll): ").strip().lower()
                 
-                if response in ('y', 'yes', ''):
-                    # Send this email
-                    break
-                elif response in ('n', 'no', 's', 'skip'):
-                    # Skip this student
-                    print(f"SKIP: {student.name}")
-                    skipped_count += 1
-                    break
-                elif response in ('q', 'quit', 'exit'):
-                    # Quit - skip remaining students
-                    print("Quitting. Remaining students will be skipped.")
-                    user_quit = True
-                    skipped_count += 1
-                    break
-                elif response in ('p', 'preview'):
-                    # Show email preview
-                    print(f"\n{'-'*70}")
-                    print(f"EMAIL PREVIEW")
-                    print(f"{'-'*70}")
-                    print(f"To: {to_email}")
-                    print(f"From: {email_config['from_email']}")
-                    print(f"Subject: {args.subject}")
-                    print(f"\n{body[:500]}...")
-                    print(f"{'-'*70}\n")
-                    continue
-                elif response in ('a', 'all'):
-                    # Send this and all remaining without asking
-                    print("Sending to all remaining students without confirmation...")
-                    args.no_confirm = True
-                    break
-                else:
-                    print("Invalid choice. Please enter 'y', 'n', 'q', 'p', or 'a'")
-                    continue
+                    if response in ('y', 'yes', ''):
+                        # Send this email
+                        break
+                    elif response in ('n', 'no', 's', 'skip'):
+                        # Skip this student
+                        print(f"SKIP: {student.name}")
+                        skipped_count += 1
+                        break
+                    elif response in ('q', 'quit', 'exit'):
+                        # Quit - skip remaining students
+                        print("Quitting. Remaining students will be skipped.")
+                        user_quit = True
+                        skipped_count += 1
+                        break
+                    elif response in ('p', 'preview'):
+                        # Show email preview
+                        print(f"\n{'-'*70}")
+                        print(f"EMAIL PREVIEW")
+                        print(f"{'-'*70}")
+                        print(f"To: {to_email}")
+                        print(f"From: {email_config['from_email']}")
+                        print(f"Subject: {args.subject}")
+                        print(f"\n{body[:500]}...")
+                        print(f"{'-'*70}\n")
+                        continue
+                    elif response in ('a', 'all'):
+                        # Send this and all remaining without asking
+                        print("Sending to all remaining students without confirmation...")
+                        args.no_confirm = True
+                        break
+                    else:
+                        print("Invalid choice. Please enter 'y', 'n', 'q', 'p', or 'a'")
+                        continue
             
-            # If user chose to skip or quit, continue to next student
-            if response in ('n', 'no', 's', 'skip') or user_quit:
-                continue
+                # If user chose to skip or quit, continue to next student
+                if response in ('n', 'no', 's', 'skip') or user_quit:
+                    continue
         
-        # Send or simulate
-        if args.dry_run:
-            print(f"WOULD SEND: {student.name} <{to_email}>")
-            print(f"  Report inlined in email body")
-            if has_excel:
-                print(f"  Excel attachment: {excel_file.name}")
-            sent_count += 1
-        else:
-            if args.no_confirm:
-                print(f"Sending to {student.name} <{to_email}>...", end=" ")
+            # Send or simulate
+            if args.dry_run:
+                print(f"WOULD SEND: {student.name} <{to_email}>")
+                print(f"  Report inlined in email body")
+                if has_excel:
+                    print(f"  Excel attachment: {excel_file.name}")
+                sent_count += 1
             else:
-                print(f"Sending...", end=" ")
-            success, _ = send_email_with_attachment(
-                to_email=to_email,
-                from_email=email_config['from_email'],
-                subject=args.subject,
-                body=body,
-                attachment_path=excel_file if has_excel else None,
-                smtp_server=email_config['smtp_server'],
-                smtp_port=email_config['smtp_port'],
-                smtp_user=email_config['smtp_user'],
-                smtp_password=email_config['smtp_password'],
-                use_tls=email_config['use_tls'],
-            )
+                send_kwargs = dict(
+                    to_email=to_email,
+                    from_email=email_config['from_email'],
+                    subject=args.subject,
+                    body=body,
+                    attachment_path=excel_file if has_excel else None,
+                    smtp_server=email_config['smtp_server'],
+                    smtp_port=email_config['smtp_port'],
+                    smtp_user=email_config['smtp_user'],
+                    smtp_password=email_config['smtp_password'],
+                    use_tls=email_config['use_tls'],
+                )
+
+                # Nothing left to confirm: overlap sends across the pool
+                if args.no_confirm and len(sessions) > 1:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=len(sessions))
+                    pending[executor.submit(send_pooled, **send_kwargs)] = (student, to_email)
+                    continue
+
+                if args.no_confirm:
+                    print(f"Sending to {student.name} <{to_email}>...", end=" ")
+                else:
+                    print(f"Sending...", end=" ")
+                success, _ = send_email_with_attachment(session=session, **send_kwargs)
+
+                if success:
+                    print("✓ Sent")
+                    sent_count += 1
+                    # Save password to cache on first successful send
+                    if email_config['smtp_user'] and email_config['smtp_password'] and sent_count == 1:
+                        save_password_to_cache(
+                            email_config['smtp_user'],
+                            email_config['smtp_server'],
+                            email_config['smtp_password']
+                        )
+                else:
+                    failed_count += 1
 
+        # Collect the pooled sends (counters are only touched on this thread)
+        for future in as_completed(pending):
+            student, to_email = pending[future]
+            success, _ = future.result()
             if success:
-                print("✓ Sent")
+                print(f"✓ Sent to {student.name} <{to_email}>")
                 sent_count += 1
                 # Save password to cache on first successful send
                 if email_config['smtp_user'] and email_config['smtp_password'] and sent_count == 1:
@@ -759,6 +1062,12 @@ I want to clarify once again that this is just for the purpose of giving you an
                     )
             else:
                 failed_count += 1
+    finally:
+        reports.close()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        for pooled in sessions:
+            pooled.close()
 
     # Summary
     print(f"\n{'='*70}")
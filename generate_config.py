@@ -156,6 +156,8 @@ def main():
         description="Generate grade configuration from Canvas assignment groups"
     )
     parser.add_argument("--course-id", type=int, help="Canvas course ID (optional)")
+    parser.add_argument("--refresh-courses", action="store_true",
+                       help="Ignore the cached course list when prompting for a course")
     parser.add_argument("--output", type=str, help="Output YAML file")
     parser.add_argument("--interactive", action="store_true",
                        help="Prompt for drop_lowest values interactively")
@@ -169,7 +171,7 @@ def main():
     # Connect to Canvas
     print("\nConnecting to Canvas...")
     conn = CanvasConnection()
-    course = Course.from_args(conn, args.course_id)
+    course = Course.from_args(conn, args.course_id, refresh_courses=args.refresh_courses)
     
     print(f"Course: {course.name}")
     print(f"Course ID: {course.course_id}")
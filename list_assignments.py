@@ -19,10 +19,12 @@ from canvas.assignment import AssignmentManager
 def main():
     parser = argparse.ArgumentParser(description="List Canvas course assignments")
     parser.add_argument("--course-id", type=int, help="Canvas course ID (optional)")
+    parser.add_argument("--refresh-courses", action="store_true",
+                       help="Ignore the cached course list when prompting for a course")
     args = parser.parse_args()
 
     conn = CanvasConnection()
-    course = Course.from_args(conn, args.course_id)
+    course = Course.from_args(conn, args.course_id, refresh_courses=args.refresh_courses)
 
     # Get assignments and groups
     assignment_mgr = AssignmentManager(course.canvas_course)
@@ -3,17 +3,26 @@
 list_courses.py
 --------------------------------
 List active Canvas courses with IDs, showing the year when available.
+
+Usage:
+  python3 list_courses.py [--refresh]
 """
 from __future__ import annotations
 
+import argparse
+
 from canvas.connection import CanvasConnection
 from canvas.course_selector import CourseSelector
 
 
 def main():
+    parser = argparse.ArgumentParser(description="List active Canvas courses")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cached course list and refetch from Canvas")
+    args = parser.parse_args()
+
     conn = CanvasConnection()
     selector = CourseSelector(conn)
-    courses = selector.get_active_courses()
+    courses = selector.get_active_courses(refresh=args.refresh)
 
     last_selected_id = selector.load_last_selection()
     selector.display_courses(last_selected_id)
@@ -189,9 +189,7 @@ class AssignmentManager:
             groups_dict = {}
             for assignment in assignments:
                 group_id = getattr(assignment, 'assignment_group_id', None)
-                if group_id not in groups_dict:
-                    groups_dict[group_id] = []
-                groups_dict[group_id].append(assignment)
+                groups_dict.setdefault(group_id, []).append(assignment)
             
             # Get assignment group names
             assignment_groups = {g.id: g.name for g in self.canvas_course.get_assignment_groups()}
@@ -731,6 +729,11 @@ def main():
         type=int,
         help="Canvas course ID (if not provided, you'll be prompted to select)"
     )
+    parser.add_argument(
+        "--refresh-courses",
+        action="store_true",
+        help="Ignore the cached course list when prompting for a course"
+    )
     args = parser.parse_args()
     
     try:
@@ -739,7 +742,7 @@ def main():
         conn = CanvasConnection()
         
         # Get course
-        course = Course.from_args(conn, args.course_id)
+        course = Course.from_args(conn, args.course_id, refresh_courses=args.refresh_courses)
         
         # Create manager and show menu
         manager = AssignmentManager(conn, course)
@@ -18,11 +18,13 @@ from canvas.course import Course
 def main():
     parser = argparse.ArgumentParser(description="Print Canvas course roster")
     parser.add_argument("--course-id", type=int, help="Canvas course ID (optional)")
+    parser.add_argument("--refresh-courses", action="store_true",
+                       help="Ignore the cached course list when prompting for a course")
     parser.add_argument("--include-inactive", action="store_true", help="Include inactive enrollments")
     args = parser.parse_args()
 
     conn = CanvasConnection()
-    course = Course.from_args(conn, args.course_id)
+    course = Course.from_args(conn, args.course_id, refresh_courses=args.refresh_courses)
     roster = course.get_roster(include_inactive=args.include_inactive)
 
     counts = roster.counts()
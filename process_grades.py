@@ -19,7 +19,7 @@ Recommended: --config grade_config_canvas.yaml
 
 Caching:
   Gradebook data is automatically cached to speed up repeated runs.
-  Cache files are named: gradebook_<course_id>_<date>.pkl
+  Cache files are named: gradebook_<course_id>_<date>.json.gz
   If a cache exists, you'll be prompted to use it or download fresh data.
   Use --no-cache to always download fresh data from Canvas.
 
@@ -250,6 +250,8 @@ def print_grade_list(processor: GradeProcessor, sort_by: str = 'name') -> None:
 def main():
     parser = argparse.ArgumentParser(description="Process Canvas course grades")
     parser.add_argument("--course-id", type=int, help="Canvas course ID (optional)")
+    parser.add_argument("--refresh-courses", action="store_true",
+                       help="Ignore the cached course list when prompting for a course")
     parser.add_argument("--config", type=str, help="Configuration YAML file (optional with --auto-config)")
     parser.add_argument("--include-inactive", action="store_true", help="Include inactive enrollments")
     parser.add_argument("--output-dir", type=str, help="Output directory for reports (default: {course}-{date})")
@@ -262,6 +264,10 @@ def main():
                        help="Generate config file and exit (shortcut for generate_config.py)")
     parser.add_argument("--modified-grade-scale", type=str, 
                        help="Path to modified letter grade scale YAML file for alternative grading")
+    parser.add_argument("--excel-values-only", action="store_true",
+                       help="Write computed values instead of formulas in Excel reports")
+    parser.add_argument("--excel-breakdown", action="store_true",
+                       help="With --excel-values-only, keep each category's average/weight/contribution rows")
     args = parser.parse_args()
 
     # Load configuration
@@ -298,7 +304,7 @@ def main():
     # Connect to Canvas to get course info
     print("Connecting to Canvas...")
     conn = CanvasConnection()
-    course = Course.from_args(conn, args.course_id)
+    course = Course.from_args(conn, args.course_id, refresh_courses=args.refresh_courses)
     course_id = course.course_id
     course_code = course.course_code  # e.g., "16.001"
     
@@ -308,7 +314,7 @@ def main():
     import glob
     import os
     
-    cache_pattern = f"gradebook_{course_id}_*.pkl"
+    cache_pattern = f"gradebook_{course_id}_*.json.gz"
     cache_files = sorted(glob.glob(cache_pattern), reverse=True)  # newest first
     
     use_cache = False
@@ -337,7 +343,7 @@ def main():
         
         # Always save to cache with course_id and date
         today = datetime.now().strftime("%Y%m%d")
-        cache_file = f"gradebook_{course_id}_{today}.pkl"
+        cache_file = f"gradebook_{course_id}_{today}.json.gz"
         gb.save_to_cache(cache_file)
 
     # Get letter grade scale (optional)
@@ -352,7 +358,7 @@ def main():
     if use_canvas_groups:
         # Fetch assignment groups from Canvas
         print("\nFetching assignment groups from Canvas...")
-        canvas_course = conn.get_canvas().get_course(course.course_id)
+        canvas_course = course.canvas_course
         
         # Check if course uses weighted groups
         uses_weights = getattr(canvas_course, 'apply_assignment_group_weights', False)
@@ -454,7 +460,9 @@ def main():
     save_csv_report(processor, str(output_dir / 'grades_summary.csv'))
     save_registrar_report(processor, course_code, str(output_dir / 'registrar_upload.csv'))
     save_anomaly_report(processor, str(output_dir / 'anomaly_report.txt'))
-    processor.save_individual_reports(str(output_dir / 'individual-grades'))
+    processor.save_individual_reports(str(output_dir / 'individual-grades'),
+                                      formulas=not args.excel_values_only,
+                                      breakdown=args.excel_breakdown)
 
     print("\nDone!")
 
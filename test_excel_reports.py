@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the grade summary row of the individual Excel reports."""
+import os
+import tempfile
+
+import openpyxl
+
+from canvas.gradebook import Gradebook
+from canvas.grade_processor import GradeProcessor
+
+
+class MockGroup:
+    def __init__(self, gid, name, weight):
+        self.id = gid
+        self.name = name
+        self.group_weight = weight
+
+
+def build_processor():
+    assignments = [
+        {"id": 1, "name": "PS1", "points_possible": 10, "assignment_group_id": 1},
+        {"id": 2, "name": "PS2", "points_possible": 10, "assignment_group_id": 1},
+        {"id": 3, "name": "Final", "points_possible": 100, "assignment_group_id": 2},
+    ]
+    students = [{"id": 101, "name": "Alice", "email": "alice@test.edu"}]
+    submissions = [
+        {"user_id": 101, "assignment_id": 1, "score": 7.0},
+        {"user_id": 101, "assignment_id": 2, "score": 9.0},
+        {"user_id": 101, "assignment_id": 3, "score": 88.0},
+    ]
+    gb = Gradebook()
+    gb.load_from_data(assignments, submissions, students)
+    groups = [MockGroup(1, "Problem Sets", 40.0), MockGroup(2, "Final Exam", 60.0)]
+    processor = GradeProcessor(gradebook=gb, assignment_groups=groups)
+    processor.process_grades(drop_lowest={}, only_graded=False)
+    return processor
+
+
+def summary_row(processor, formulas):
+    """Save the reports and return (sheet names, summary row cells, student)."""
+    student = next(iter(processor.processed_students.values()))
+    with tempfile.TemporaryDirectory() as tmp:
+        processor.save_individual_reports(tmp, include_excel=True, formulas=formulas)
+        wb = openpyxl.load_workbook(os.path.join(tmp, f"{student.name}.xlsx"))
+    ws = wb.active
+    row = next(r for r in ws.iter_rows(values_only=True)
+               if r[0] in ("FINAL GRADE:", "CURRENT GRADE (on graded work):"))
+    return wb.sheetnames, row, student
+
+
+def test_summary_row_with_formulas():
+    sheets, row, _ = summary_row(build_processor(), formulas=True)
+    # Percentage points at the final grade row; the letter is looked up live
+    assert row[3].startswith("=D")
+    assert row[4].startswith("=VLOOKUP(") and "Grades!A:B" in row[4]
+    assert "Grades" in sheets
+
+
+def test_summary_row_values_only():
+    sheets, row, student = summary_row(build_processor(), formulas=False)
+    assert abs(row[3] - student.normalized_percentage) < 1e-9
+    assert row[4] == student.letter_grade
+    assert sheets == [sheets[0]]  # no grade conversion sheets
+
+
+if __name__ == "__main__":
+    test_summary_row_with_formulas()
+    test_summary_row_values_only()
+    print("Excel report tests passed.")
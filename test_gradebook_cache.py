@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Round-trip test for the gzip-compressed JSON gradebook cache."""
+import os
+import tempfile
+
+from canvas.gradebook import Gradebook
+
+
+def build_gradebook():
+    assignments = [
+        {"id": 1, "name": "HW1 (online)", "points_possible": 10, "due_at": "2024-09-10T04:00:00Z",
+         "assignment_group_id": 7},
+        {"id": 2, "name": "Quiz", "points_possible": None},
+    ]
+    students = [
+        {"id": 10, "name": "Alice", "login": "alice", "email": "alice@test.edu", "sis_user_id": "900000001"},
+        {"id": 11, "name": "Bob"},
+    ]
+    submissions = [
+        {"user_id": 10, "assignment_id": 1, "score": 9.5, "submitted_at": "2024-09-09T12:00:00Z",
+         "workflow_state": "graded", "late": False},
+        {"user_id": 10, "assignment_id": 2, "score": None, "missing": True},
+        {"user_id": 11, "assignment_id": 1, "excused": True},
+    ]
+    gb = Gradebook()
+    gb.course_id = 1234
+    gb.load_from_data(assignments, submissions, students)
+    return gb
+
+
+def test_cache_round_trip():
+    gb = build_gradebook()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, "gradebook_1234_20240101.json.gz")
+        gb.save_to_cache(cache_file)
+        assert os.listdir(tmp) == ["gradebook_1234_20240101.json.gz"]  # no temp file left
+        loaded = Gradebook.load_from_cache(cache_file)
+
+    assert loaded.course_id == 1234
+    assert loaded.assignments == gb.assignments
+    assert loaded.students.keys() == gb.students.keys()
+    for uid, student in gb.students.items():
+        assert loaded.students[uid] == student
+    assert loaded.get_student(10).percent == gb.get_student(10).percent
+
+
+if __name__ == "__main__":
+    test_cache_round_trip()
+    print("Gradebook cache tests passed.")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Synthetic test for Gradebook analytics without Canvas API access."""
+from canvas.course import Course
 from canvas.gradebook import Gradebook
 
 
@@ -45,6 +46,49 @@ def test_totals():
     assert overall["count"] == 3
 
 
+class FakeGraphQLConnection:
+    """Stands in for CanvasConnection.graphql() with canned responses."""
+
+    def graphql(self, query, variables=None):
+        if "query Gradebook" in query:
+            return {"course": {"assignmentsConnection": {
+                "pageInfo": {"hasNextPage": False},
+                "nodes": [{
+                    "_id": "1", "name": "HW1", "pointsPossible": 100, "dueAt": None,
+                    "assignmentGroup": {"_id": "7"},
+                    "submissionsConnection": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                        "nodes": [{"userId": "10", "score": 95, "excused": False, "state": "graded"}],
+                    },
+                }],
+            }}}
+        if "query SubmissionsPage" in query:
+            assert variables["after"] == "c1"
+            return {"assignment": {"submissionsConnection": {
+                "pageInfo": {"hasNextPage": False},
+                "nodes": [{"userId": "11", "score": 80, "excused": False, "state": "graded"}],
+            }}}
+        return {"course": {"enrollmentsConnection": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {"user": {"_id": "10", "name": "Alice", "sisId": "900000001"}},
+                {"user": {"_id": "11", "name": "Bob"}},
+            ],
+        }}}
+
+
+def test_graphql_gradebook():
+    data = Course(FakeGraphQLConnection(), 1234).get_gradebook_graphql()
+    gb = Gradebook()
+    gb.load_from_data(data["assignments"], data["submissions"], data["students"])
+
+    assert gb.assignments[1].assignment_group_id == 7
+    assert gb.get_student(10).sis_user_id == "900000001"
+    assert round(gb.get_student(10).percent, 2) == 95.0
+    assert round(gb.get_student(11).percent, 2) == 80.0
+
+
 if __name__ == "__main__":
     test_totals()
+    test_graphql_gradebook()
     print("Synthetic gradebook tests passed.")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Boundary tests for bisect-based letter grade lookup."""
+from canvas.grade_processor import letter_grade, letter_grade_sorted, sort_scale
+
+SCALE = {
+    0.00: 'F',
+    0.61: 'D',
+    0.70: 'C',
+    0.80: 'B',
+    0.90: 'A',
+}
+SORTED_SCALE = sort_scale(SCALE)
+
+
+def test_exact_thresholds():
+    # A percentage equal to a threshold earns that threshold's grade
+    for threshold, grade in SCALE.items():
+        assert letter_grade_sorted(threshold, SORTED_SCALE) == grade
+
+
+def test_just_below_thresholds():
+    assert letter_grade_sorted(0.8999999, SORTED_SCALE) == 'B'
+    assert letter_grade_sorted(0.7999999, SORTED_SCALE) == 'C'
+    assert letter_grade_sorted(0.6099999, SORTED_SCALE) == 'F'
+
+
+def test_out_of_range():
+    # Below the lowest threshold clamps to the lowest grade, above 100% to the top
+    assert letter_grade_sorted(-0.05, SORTED_SCALE) == 'F'
+    assert letter_grade_sorted(1.20, SORTED_SCALE) == 'A'
+
+
+def test_unsorted_scale_and_letter_grade_agree():
+    shuffled = dict(reversed(list(SCALE.items())))
+    assert sort_scale(shuffled) == SORTED_SCALE
+    for pct in (0.0, 0.3, 0.61, 0.695, 0.7, 0.85, 0.9, 1.0):
+        assert letter_grade(pct, shuffled) == letter_grade_sorted(pct, SORTED_SCALE)
+
+
+if __name__ == "__main__":
+    test_exact_thresholds()
+    test_just_below_thresholds()
+    test_out_of_range()
+    test_unsorted_scale_and_letter_grade_agree()
+    print("Letter grade tests passed.")
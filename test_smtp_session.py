@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Tests for SMTPSession connection reuse against a fake SMTP server."""
+import smtplib
+from email.message import EmailMessage
+
+import email_grades
+
+
+class FakeSMTP:
+    """Stands in for smtplib.SMTP; each instance is one server connection."""
+
+    connections = []
+    # Number of messages a connection accepts before the server hangs up
+    drop_after = None
+
+    def __init__(self, host, port):
+        self.sent = []
+        self.closed = False
+        FakeSMTP.connections.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        if self.closed or (self.drop_after is not None and len(self.sent) >= self.drop_after):
+            self.closed = True
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(msg["To"])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+def make_message(to):
+    msg = EmailMessage()
+    msg["To"] = to
+    msg.set_content("test")
+    return msg
+
+
+def run_session(drop_after, recipients):
+    FakeSMTP.connections = []
+    FakeSMTP.drop_after = drop_after
+    real_smtp = smtplib.SMTP
+    smtplib.SMTP = FakeSMTP
+    try:
+        with email_grades.SMTPSession("smtp.test", 587) as session:
+            for to in recipients:
+                session.send(make_message(to))
+    finally:
+        smtplib.SMTP = real_smtp
+    return FakeSMTP.connections
+
+
+def test_connection_reused():
+    connections = run_session(None, ["a@x.edu", "b@x.edu", "c@x.edu"])
+    assert len(connections) == 1
+    assert connections[0].sent == ["a@x.edu", "b@x.edu", "c@x.edu"]
+    assert connections[0].closed
+
+
+def test_reconnect_after_disconnect():
+    # The server drops the connection after two messages; the third is
+    # retried once on a fresh connection
+    connections = run_session(2, ["a@x.edu", "b@x.edu", "c@x.edu"])
+    assert len(connections) == 2
+    assert connections[0].sent == ["a@x.edu", "b@x.edu"]
+    assert connections[1].sent == ["c@x.edu"]
+
+
+def test_fresh_connection_failure_not_retried():
+    try:
+        run_session(0, ["a@x.edu"])
+    except smtplib.SMTPServerDisconnected:
+        pass
+    else:
+        raise AssertionError("expected SMTPServerDisconnected")
+    assert len(FakeSMTP.connections) == 1
+
+
+if __name__ == "__main__":
+    test_connection_reused()
+    test_reconnect_after_disconnect()
+    test_fresh_connection_failure_not_retried()
+    print("SMTP session tests passed.")